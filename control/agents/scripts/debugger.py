@@ -1,6 +1,7 @@
 
 import json
 import os
+import re
 import sys
 import yaml
 from pathlib import Path
@@ -19,8 +20,18 @@ except ImportError:
 BASE_TEMPLATE_PATH = "control/agents/debugger/base.md"
 LANG_TEMPLATE_PATH = "control/agents/debugger/{lang}.md"
 OUTPUT_PATH = "generated/.opencode/agent/subagent/debugger.md"
+OUTPUT_PATHS = {
+    'subagent': "generated/.opencode/agent/subagent/debugger.md",
+    'primary': "generated/.opencode/agent/debugger.md",
+}
 CONFIG_KEYS = {'enabled', 'template', 'template_file', 'additional_files', 'additional_files_strategy', 'include_base_template', 'lang'}
-SUPPORTED_LANGUAGES = ['elixir', 'kotlin', 'typescript']
+SUPPORTED_LANGUAGES = frozenset({'elixir', 'kotlin', 'typescript'})
+SUPPORTED_LANGUAGES_LIST = ', '.join(sorted(SUPPORTED_LANGUAGES))
+ADDITIONAL_FILES_STRATEGIES = frozenset({'merge', 'replace'})
+# Leading '---' fenced block plus any blank lines after it; fence lines may carry surrounding whitespace
+FRONTMATTER_PATTERN = re.compile(
+    r"\A[^\S\n]*---[^\S\n]*\n(?:.*\n)*?[^\S\n]*---[^\S\n]*(?:\n|\Z)(?:[^\S\n]*\n)*(?:[^\S\n]*\Z)?"
+)
 
 
 class DebuggerAgentGenerator:
@@ -66,11 +77,10 @@ class DebuggerAgentGenerator:
         include_base_template = debugger_config.get('include_base_template', True)
         lang = debugger_config.get('lang', '')
 
-        supported_languages = ['elixir', 'kotlin', 'typescript']
-        if lang and lang not in supported_languages:
-            raise ValueError(f"Unsupported language: {lang}. Supported languages: {', '.join(supported_languages)}")
+        if lang and lang not in SUPPORTED_LANGUAGES:
+            raise ValueError(f"Unsupported language: {lang}. Supported languages: {SUPPORTED_LANGUAGES_LIST}")
 
-        if additional_files_strategy not in ['merge', 'replace']:
+        if additional_files_strategy not in ADDITIONAL_FILES_STRATEGIES:
             raise ValueError(f"Invalid additional_files_strategy: {additional_files_strategy}. Must be 'merge' or 'replace'")
 
         if template_type == 'custom' and not template_file:
@@ -86,28 +96,28 @@ class DebuggerAgentGenerator:
 
                 if include_base_template:
                     base_template_path = self.project_root / "control/agents/debugger/base.md"
-                    if not base_template_path.exists():
+                    base_stat = self._stat_template(base_template_path)
+                    if base_stat is None:
                         raise FileNotFoundError(f"Base template not found: {base_template_path}")
 
                     try:
-                        with open(base_template_path, 'r', encoding='utf-8') as f:
-                            base_content = f.read()
-                            template_content_parts.append(base_content)
+                        base_content = base_template_path.read_text(encoding='utf-8')
+                        template_content_parts.append(base_content)
                     except Exception as e:
                         raise ValueError(f"Failed to read base template {base_template_path}: {e}")
 
                 if lang:
                     lang_template_path = self.project_root / f"control/agents/debugger/{lang}.md"
-                    if not lang_template_path.exists():
+                    lang_stat = self._stat_template(lang_template_path)
+                    if lang_stat is None:
                         raise FileNotFoundError(f"Language template not found: {lang_template_path}")
 
-                    if lang_template_path.stat().st_size == 0:
+                    if lang_stat.st_size == 0:
                         print(f"Warning: Language template is empty: {lang_template_path}. Skipping language-specific content.")
                     else:
                         try:
-                            with open(lang_template_path, 'r', encoding='utf-8') as f:
-                                lang_content = f.read()
-                                template_content_parts.append(f"\n\n# {lang.title()} Debugging Specifics\n\n{lang_content}")
+                            lang_content = lang_template_path.read_text(encoding='utf-8')
+                            template_content_parts.append(f"\n\n# {lang.title()} Debugging Specifics\n\n{lang_content}")
                         except Exception as e:
                             raise ValueError(f"Failed to read language template {lang_template_path}: {e}")
 
@@ -121,15 +131,15 @@ class DebuggerAgentGenerator:
                 if not custom_template_path.is_absolute():
                     custom_template_path = self.project_root / custom_template_path
 
-                if not custom_template_path.exists():
+                custom_stat = self._stat_template(custom_template_path)
+                if custom_stat is None:
                     raise FileNotFoundError(f"Custom template file not found: {custom_template_path}")
 
-                if custom_template_path.stat().st_size == 0:
+                if custom_stat.st_size == 0:
                     raise ValueError(f"Custom template file is empty: {custom_template_path}")
 
                 try:
-                    with open(custom_template_path, 'r', encoding='utf-8') as f:
-                        main_template_content = f.read()
+                    main_template_content = custom_template_path.read_text(encoding='utf-8')
                 except Exception as e:
                     raise ValueError(f"Failed to read custom template file {custom_template_path}: {e}")
             else:
@@ -147,6 +157,14 @@ class DebuggerAgentGenerator:
         else:
             return main_template_content
 
+    @staticmethod
+    def _stat_template(template_path: Path) -> Optional[os.stat_result]:
+        # One stat serves both the existence check and the emptiness check
+        try:
+            return template_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     def _process_additional_files(self, additional_files: list) -> str:
         if not additional_files:
             return ""
@@ -172,12 +190,8 @@ class DebuggerAgentGenerator:
         return "\n\n".join(combined_content)
 
     def _get_output_path(self, debugger_config: Dict[str, Any]) -> str:
-        mode = debugger_config.get('mode', 'primary')
-
-        if mode == 'subagent':
-            return "generated/.opencode/agent/subagent/debugger.md"
-        else:
-            return "generated/.opencode/agent/debugger.md"
+        # Any mode other than 'subagent' writes the primary agent file
+        return OUTPUT_PATHS.get(debugger_config.get('mode'), OUTPUT_PATHS['primary'])
 
     def _extract_agent_config(self, debugger_config: Dict[str, Any]) -> Dict[str, Any]:
         config_keys = {
@@ -260,15 +274,9 @@ class DebuggerAgentGenerator:
         print(f"Generated debugger agent configuration: {output_file}")
 
     def _strip_frontmatter(self, content: str) -> str:
-        lines = content.split('\n')
-
-        if lines and lines[0].strip() == '---':
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    remaining_lines = lines[i+1:]
-                    while remaining_lines and not remaining_lines[0].strip():
-                        remaining_lines = remaining_lines[1:]
-                    return '\n'.join(remaining_lines)
+        match = FRONTMATTER_PATTERN.match(content)
+        if match:
+            return content[match.end():]
 
         return content
 
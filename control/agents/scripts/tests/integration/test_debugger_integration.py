@@ -6,45 +6,44 @@ This module contains integration tests that test the full workflow of the
 DebuggerAgentGenerator class from configuration loading to file generation.
 """
 
-import os
+import re
+import shutil
 import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-# Add the parent directory to the path to import the generator
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add the scripts directory to the path once per process to import the generator
+SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent.parent)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
 
-from debugger import DebuggerAgentGenerator
+# Imported on first use so test discovery doesn't load the generator module
+_DebuggerAgentGenerator = None
 
 
-class TestDebuggerGeneratorIntegration(unittest.TestCase):
-    """Integration test cases for the DebuggerAgentGenerator class."""
+def load_debugger_generator():
+    """Return the DebuggerAgentGenerator class, importing it on first call."""
+    global _DebuggerAgentGenerator
+    if _DebuggerAgentGenerator is None:
+        from debugger import DebuggerAgentGenerator
+        _DebuggerAgentGenerator = DebuggerAgentGenerator
+    return _DebuggerAgentGenerator
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = Path(self.temp_dir) / "config.toml"
 
-        # Create template directory structure
-        self.template_dir = Path(self.temp_dir) / "control/agents/debugger"
-        self.template_dir.mkdir(parents=True, exist_ok=True)
+SUBAGENT_OUTPUT_PATH = "generated/.opencode/agent/subagent/debugger.md"
+PRIMARY_OUTPUT_PATH = "generated/.opencode/agent/debugger.md"
 
-        # Create base template
-        base_template_content = """You are an intelligent debugging agent that analyzes provided arguments to determine the optimal debugging approach.
+TEMPLATE_FIXTURES = {
+    "base.md": """You are an intelligent debugging agent that analyzes provided arguments to determine the optimal debugging approach.
 
 ## Core Responsibilities
 
 - **Argument Analysis**: Parse input to understand debugging scope, language, and context
 - **Technology Detection**: Identify the appropriate language/framework from available configurations
 - **Adaptive Debugging**: Apply language-specific debugging techniques when configured languages are detected
-"""
-
-        with open(self.template_dir / "base.md", 'w') as f:
-            f.write(base_template_content)
-
-        # Create language-specific templates
-        elixir_template = """### Core Tools & Commands
+""",
+    "elixir.md": """### Core Tools & Commands
 
 **Basic Debugging:**
 
@@ -55,9 +54,8 @@ data |> IO.inspect(label: "checkpoint") |> process()
 # Enhanced debugging (Elixir 1.14+)
 result |> dbg()
 ```
-"""
-
-        kotlin_template = """### Kotlin Debugging Tools
+""",
+    "kotlin.md": """### Kotlin Debugging Tools
 
 **Basic Debugging:**
 
@@ -68,9 +66,8 @@ println("Debug: $variable")
 // Breakpoint debugging
 debugger()
 ```
-"""
-
-        typescript_template = """### TypeScript Debugging Tools
+""",
+    "typescript.md": """### TypeScript Debugging Tools
 
 **Basic Debugging:**
 
@@ -81,26 +78,56 @@ console.log('Debug:', variable);
 // Debugger statement
 debugger;
 ```
-"""
+""",
+}
 
-        with open(self.template_dir / "elixir.md", 'w') as f:
-            f.write(elixir_template)
 
-        with open(self.template_dir / "kotlin.md", 'w') as f:
-            f.write(kotlin_template)
+class TestDebuggerGeneratorIntegration(unittest.TestCase):
+    """Integration test cases for the DebuggerAgentGenerator class."""
 
-        with open(self.template_dir / "typescript.md", 'w') as f:
-            f.write(typescript_template)
+    @classmethod
+    def setUpClass(cls):
+        """Write the template fixtures once into a pristine directory copied by each test."""
+        # Per-test directories live under the same root so one rmtree clears the whole class
+        cls.temp_root = tempfile.mkdtemp()
+        cls.template_root = Path(cls.temp_root) / "templates"
+        cls.template_root.mkdir()
+        for template_name, template_content in TEMPLATE_FIXTURES.items():
+            (cls.template_root / template_name).write_text(template_content)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the pristine templates and every per-test directory."""
+        shutil.rmtree(cls.temp_root, ignore_errors=True)
 
-    def tearDown(self):
-        """Clean up test fixtures after each test method."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.temp_dir = tempfile.mkdtemp(dir=self.temp_root)
+        self.config_path = Path(self.temp_dir) / "config.toml"
+
+        # Copy the template directory structure from the class-level snapshot
+        self.template_dir = Path(self.temp_dir) / "control/agents/debugger"
+        shutil.copytree(self.template_root, self.template_dir)
 
     def create_config_file(self, config_content: str):
         """Helper method to create a config file with given content."""
-        with open(self.config_path, 'w') as f:
-            f.write(config_content)
+        self.config_path.write_text(config_content)
+
+    def assert_contains_all(self, content: str, needles: list):
+        """Assert every needle occurs in content, scanning it once."""
+        pattern = re.compile('|'.join(re.escape(needle) for needle in needles))
+        seen = {match.group() for match in pattern.finditer(content)}
+        # Needles hidden inside an overlapping match are rechecked directly
+        missing = [needle for needle in needles if needle not in seen and needle not in content]
+        if missing:
+            self.fail(f"Missing from output: {missing}")
+
+    def assert_contains_none(self, content: str, needles: list):
+        """Assert no needle occurs in content, scanning it once."""
+        pattern = re.compile('|'.join(re.escape(needle) for needle in needles))
+        found = sorted({match.group() for match in pattern.finditer(content)})
+        if found:
+            self.fail(f"Unexpected in output: {found}")
 
     def test_full_workflow_elixir_subagent(self):
         """Test full workflow with Elixir language and subagent mode."""
@@ -110,7 +137,7 @@ debugger = {enabled = true, template = "default", lang = "elixir", template_file
 """
 
         self.create_config_file(config_content)
-        generator = DebuggerAgentGenerator(str(self.config_path))
+        generator = load_debugger_generator()(str(self.config_path))
 
         # Update the generator's project root to point to our temp directory
         generator.project_root = Path(self.temp_dir)
@@ -122,37 +149,38 @@ debugger = {enabled = true, template = "default", lang = "elixir", template_file
         self.assertTrue(success)
 
         # Verify output file was created
-        expected_output_path = Path(self.temp_dir) / "generated/.opencode/agent/subagent/debugger.md"
+        expected_output_path = Path(self.temp_dir) / SUBAGENT_OUTPUT_PATH
         self.assertTrue(expected_output_path.exists())
 
         # Verify output content
-        with open(expected_output_path, 'r') as f:
-            content = f.read()
-
-        # Check YAML frontmatter
-        self.assertIn('---', content)
-        self.assertIn('description: "Elixir debugging specialist"', content)
-        self.assertIn('mode: "subagent"', content)
-        self.assertIn('model: "anthropic/claude-sonnet-4-20250514"', content)
-        self.assertIn('temperature: 0.1', content)
-        self.assertIn('permissions:', content)
-        self.assertIn('tools:', content)
-        self.assertIn('bash:', content)
-        self.assertIn('edit:', content)
-
-        # Check that config keys are excluded
-        self.assertNotIn('enabled:', content)
-        self.assertNotIn('template:', content)
-        self.assertNotIn('lang:', content)
-        self.assertNotIn('include_base_template:', content)
-
-        # Check base template content
-        self.assertIn('You are an intelligent debugging agent', content)
-
-        # Check Elixir-specific content
-        self.assertIn('# Elixir Debugging Specifics', content)
-        self.assertIn('Pipeline inspection', content)
-        self.assertIn('IO.inspect', content)
+        content = expected_output_path.read_text()
+
+        self.assert_contains_all(content, [
+            # Check YAML frontmatter
+            '---',
+            'description: "Elixir debugging specialist"',
+            'mode: "subagent"',
+            'model: "anthropic/claude-sonnet-4-20250514"',
+            'temperature: 0.1',
+            'permissions:',
+            'tools:',
+            'bash:',
+            'edit:',
+            # Check base template content
+            'You are an intelligent debugging agent',
+            # Check Elixir-specific content
+            '# Elixir Debugging Specifics',
+            'Pipeline inspection',
+            'IO.inspect',
+        ])
+
+        self.assert_contains_none(content, [
+            # Check that config keys are excluded
+            'enabled:',
+            'template:',
+            'lang:',
+            'include_base_template:',
+        ])
 
     def test_full_workflow_kotlin_primary(self):
         """Test full workflow with Kotlin language and primary mode."""
@@ -162,7 +190,7 @@ debugger = {enabled = true, template = "default", lang = "kotlin", template_file
 """
 
         self.create_config_file(config_content)
-        generator = DebuggerAgentGenerator(str(self.config_path))
+        generator = load_debugger_generator()(str(self.config_path))
 
         # Update the generator's project root to point to our temp directory
         generator.project_root = Path(self.temp_dir)
@@ -174,21 +202,21 @@ debugger = {enabled = true, template = "default", lang = "kotlin", template_file
         self.assertTrue(success)
 
         # Verify output file was created in primary agent directory
-        expected_output_path = Path(self.temp_dir) / "generated/.opencode/agent/debugger.md"
+        expected_output_path = Path(self.temp_dir) / PRIMARY_OUTPUT_PATH
         self.assertTrue(expected_output_path.exists())
 
         # Verify output content
-        with open(expected_output_path, 'r') as f:
-            content = f.read()
-
-        # Check YAML frontmatter
-        self.assertIn('description: "Kotlin debugging specialist"', content)
-        self.assertIn('mode: "primary"', content)
-        self.assertIn('temperature: 0.2', content)
-
-        # Check Kotlin-specific content
-        self.assertIn('# Kotlin Debugging Specifics', content)
-        self.assertIn('println("Debug: $variable")', content)
+        content = expected_output_path.read_text()
+
+        self.assert_contains_all(content, [
+            # Check YAML frontmatter
+            'description: "Kotlin debugging specialist"',
+            'mode: "primary"',
+            'temperature: 0.2',
+            # Check Kotlin-specific content
+            '# Kotlin Debugging Specifics',
+            'println("Debug: $variable")',
+        ])
 
     def test_full_workflow_typescript_base_only(self):
         """Test full workflow with TypeScript language but no base template."""
@@ -198,7 +226,7 @@ debugger = {enabled = true, template = "default", lang = "typescript", template_
 """
 
         self.create_config_file(config_content)
-        generator = DebuggerAgentGenerator(str(self.config_path))
+        generator = load_debugger_generator()(str(self.config_path))
 
         # Update the generator's project root to point to our temp directory
         generator.project_root = Path(self.temp_dir)
@@ -210,24 +238,24 @@ debugger = {enabled = true, template = "default", lang = "typescript", template_
         self.assertTrue(success)
 
         # Verify output file was created
-        expected_output_path = Path(self.temp_dir) / "generated/.opencode/agent/subagent/debugger.md"
+        expected_output_path = Path(self.temp_dir) / SUBAGENT_OUTPUT_PATH
         self.assertTrue(expected_output_path.exists())
 
         # Verify output content
-        with open(expected_output_path, 'r') as f:
-            content = f.read()
+        content = expected_output_path.read_text()
 
-        # Check YAML frontmatter
-        self.assertIn('description: "TypeScript debugging specialist"', content)
-        self.assertIn('temperature: 0.0', content)
+        self.assert_contains_all(content, [
+            # Check YAML frontmatter
+            'description: "TypeScript debugging specialist"',
+            'temperature: 0.0',
+            # Should have TypeScript-specific content
+            '# Typescript Debugging Specifics',
+            'console.log',
+        ])
 
         # Should NOT have base template content
         self.assertNotIn('You are an intelligent debugging agent', content)
 
-        # Should have TypeScript-specific content
-        self.assertIn('# Typescript Debugging Specifics', content)
-        self.assertIn('console.log', content)
-
     def test_full_workflow_disabled_configuration(self):
         """Test full workflow with disabled debugger configuration."""
         config_content = """
@@ -236,7 +264,7 @@ debugger = {enabled = false, template = "default", lang = "elixir", description
 """
 
         self.create_config_file(config_content)
-        generator = DebuggerAgentGenerator(str(self.config_path))
+        generator = load_debugger_generator()(str(self.config_path))
 
         # Update the generator's project root to point to our temp directory
         generator.project_root = Path(self.temp_dir)
@@ -248,7 +276,7 @@ debugger = {enabled = false, template = "default", lang = "elixir", description
         self.assertFalse(success)
 
         # Verify no output file was created
-        expected_output_path = Path(self.temp_dir) / "generated/.opencode/agent/subagent/debugger.md"
+        expected_output_path = Path(self.temp_dir) / SUBAGENT_OUTPUT_PATH
         self.assertFalse(expected_output_path.exists())
 
     def test_full_workflow_custom_template(self):
@@ -265,8 +293,7 @@ This is a custom debugger template with specific instructions.
 """
 
         custom_template_path = Path(self.temp_dir) / "custom_debugger.md"
-        with open(custom_template_path, 'w') as f:
-            f.write(custom_template_content)
+        custom_template_path.write_text(custom_template_content)
 
         config_content = f"""
 [opencode.agents.subagents]
@@ -274,7 +301,7 @@ debugger = {{enabled = true, template = "custom", template_file = "{custom_templ
 """
 
         self.create_config_file(config_content)
-        generator = DebuggerAgentGenerator(str(self.config_path))
+        generator = load_debugger_generator()(str(self.config_path))
 
         # Update the generator's project root to point to our temp directory
         generator.project_root = Path(self.temp_dir)
@@ -286,17 +313,18 @@ debugger = {{enabled = true, template = "custom", template_file = "{custom_templ
         self.assertTrue(success)
 
         # Verify output file was created
-        expected_output_path = Path(self.temp_dir) / "generated/.opencode/agent/subagent/debugger.md"
+        expected_output_path = Path(self.temp_dir) / SUBAGENT_OUTPUT_PATH
         self.assertTrue(expected_output_path.exists())
 
         # Verify output content
-        with open(expected_output_path, 'r') as f:
-            content = f.read()
+        content = expected_output_path.read_text()
 
-        # Check custom template content
-        self.assertIn('# Custom Debugger Agent', content)
-        self.assertIn('This is a custom debugger template', content)
-        self.assertIn('Custom Features', content)
+        self.assert_contains_all(content, [
+            # Check custom template content
+            '# Custom Debugger Agent',
+            'This is a custom debugger template',
+            'Custom Features',
+        ])
 
     def test_full_workflow_additional_files_merge(self):
         """Test full workflow with additional files using merge strategy."""
@@ -311,8 +339,7 @@ debugger = {{enabled = true, template = "custom", template_file = "{custom_templ
 """
 
         additional_file_path = Path(self.temp_dir) / "additional_debug.md"
-        with open(additional_file_path, 'w') as f:
-            f.write(additional_file_content)
+        additional_file_path.write_text(additional_file_content)
 
         config_content = f"""
 [opencode.agents.subagents]
@@ -320,7 +347,7 @@ debugger = {{enabled = true, template = "default", lang = "elixir", additional_f
 """
 
         self.create_config_file(config_content)
-        generator = DebuggerAgentGenerator(str(self.config_path))
+        generator = load_debugger_generator()(str(self.config_path))
 
         # Update the generator's project root to point to our temp directory
         generator.project_root = Path(self.temp_dir)
@@ -332,23 +359,22 @@ debugger = {{enabled = true, template = "default", lang = "elixir", additional_f
         self.assertTrue(success)
 
         # Verify output file was created
-        expected_output_path = Path(self.temp_dir) / "generated/.opencode/agent/subagent/debugger.md"
+        expected_output_path = Path(self.temp_dir) / SUBAGENT_OUTPUT_PATH
         self.assertTrue(expected_output_path.exists())
 
         # Verify output content
-        with open(expected_output_path, 'r') as f:
-            content = f.read()
-
-        # Check base template content
-        self.assertIn('You are an intelligent debugging agent', content)
-
-        # Check Elixir-specific content
-        self.assertIn('# Elixir Debugging Specifics', content)
-
-        # Check additional files content
-        self.assertIn('# Additional Files', content)
-        self.assertIn('Additional Debugging Guidelines', content)
-        self.assertIn('Security Considerations', content)
+        content = expected_output_path.read_text()
+
+        self.assert_contains_all(content, [
+            # Check base template content
+            'You are an intelligent debugging agent',
+            # Check Elixir-specific content
+            '# Elixir Debugging Specifics',
+            # Check additional files content
+            '# Additional Files',
+            'Additional Debugging Guidelines',
+            'Security Considerations',
+        ])
 
     def test_full_workflow_additional_files_replace(self):
         """Test full workflow with additional files using replace strategy."""
@@ -364,8 +390,7 @@ This content replaces the default template entirely.
 """
 
         replacement_file_path = Path(self.temp_dir) / "replacement_debug.md"
-        with open(replacement_file_path, 'w') as f:
-            f.write(replacement_content)
+        replacement_file_path.write_text(replacement_content)
 
         config_content = f"""
 [opencode.agents.subagents]
@@ -373,7 +398,7 @@ debugger = {{enabled = true, template = "default", lang = "elixir", additional_f
 """
 
         self.create_config_file(config_content)
-        generator = DebuggerAgentGenerator(str(self.config_path))
+        generator = load_debugger_generator()(str(self.config_path))
 
         # Update the generator's project root to point to our temp directory
         generator.project_root = Path(self.temp_dir)
@@ -385,20 +410,21 @@ debugger = {{enabled = true, template = "default", lang = "elixir", additional_f
         self.assertTrue(success)
 
         # Verify output file was created
-        expected_output_path = Path(self.temp_dir) / "generated/.opencode/agent/subagent/debugger.md"
+        expected_output_path = Path(self.temp_dir) / SUBAGENT_OUTPUT_PATH
         self.assertTrue(expected_output_path.exists())
 
         # Verify output content
-        with open(expected_output_path, 'r') as f:
-            content = f.read()
+        content = expected_output_path.read_text()
+
+        self.assert_contains_all(content, [
+            # Should have replacement content
+            '# Replacement Debugger Content',
+            'This content replaces the default template',
+        ])
 
         # Should NOT have base template content (replaced)
         self.assertNotIn('You are an intelligent debugging agent', content)
 
-        # Should have replacement content
-        self.assertIn('# Replacement Debugger Content', content)
-        self.assertIn('This content replaces the default template', content)
-
 
 if __name__ == '__main__':
     unittest.main()
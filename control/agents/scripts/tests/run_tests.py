@@ -5,19 +5,40 @@ Test runner for debugger agent generator tests.
 This script runs all unit and integration tests for the debugger agent generator.
 """
 
+import os
+import platform
 import sys
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add the parent directory to the path to import test modules
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the tests directory to the path once to import test modules
+TESTS_DIR = str(Path(__file__).resolve().parent)
+if TESTS_DIR not in sys.path:
+    sys.path.insert(0, TESTS_DIR)
+
+TEST_SUITES = ['unit', 'integration']
+
+def use_memory_tmpdir():
+    """Keep test temp directories on tmpfs when running on Linux, unless TMPDIR is already set."""
+    # Kept in sync with use_memory_tmpdir() in control/commands/scripts/tests/run_tests.py
+    if platform.system() == 'Linux' and os.path.isdir('/dev/shm') and 'TMPDIR' not in os.environ:
+        os.environ['TMPDIR'] = '/dev/shm'
+        # Drop tempfile's cached directory so the new TMPDIR is picked up
+        tempfile.tempdir = None
+
+def discover_suite(suite_name: str) -> unittest.TestSuite:
+    """Discover one test directory with its own loader so suites can be discovered concurrently."""
+    suite_dir = Path(TESTS_DIR) / suite_name
+    loader = unittest.TestLoader()
+    return loader.discover(suite_dir, pattern='test_*.py', top_level_dir=suite_dir)
 
 def run_all_tests():
     """Run all unit and integration tests."""
-    # Discover and run all tests
-    loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    # unit/ and integration/ are not packages, so discover each directory separately and overlap the walks
+    with ThreadPoolExecutor(max_workers=len(TEST_SUITES)) as executor:
+        suite = unittest.TestSuite(executor.map(discover_suite, TEST_SUITES))
     
     # Run the tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -47,8 +68,7 @@ def run_all_tests():
 
 def run_unit_tests():
     """Run only unit tests."""
-    loader = unittest.TestLoader()
-    suite = loader.discover(Path(__file__).parent / 'unit', pattern='test_*.py')
+    suite = discover_suite('unit')
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -57,8 +77,7 @@ def run_unit_tests():
 
 def run_integration_tests():
     """Run only integration tests."""
-    loader = unittest.TestLoader()
-    suite = loader.discover(Path(__file__).parent / 'integration', pattern='test_*.py')
+    suite = discover_suite('integration')
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -66,6 +85,7 @@ def run_integration_tests():
     return len(result.failures) == 0 and len(result.errors) == 0
 
 if __name__ == '__main__':
+    use_memory_tmpdir()
     if len(sys.argv) > 1:
         if sys.argv[1] == 'unit':
             success = run_unit_tests()
@@ -7,6 +7,7 @@ covering configuration loading, validation, template handling, and agent file ge
 """
 
 import os
+import shutil
 import sys
 import tempfile
 import unittest
@@ -99,7 +100,6 @@ You are a multi-language implementation agent for modular and functional develop
 
     def tearDown(self):
         """Clean up test fixtures after each test method."""
-        import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_load_toml_config_success(self):
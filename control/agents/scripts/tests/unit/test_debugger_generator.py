@@ -7,6 +7,7 @@ covering configuration loading, validation, template handling, and agent file ge
 """
 
 import os
+import shutil
 import sys
 import tempfile
 import unittest
@@ -16,20 +17,17 @@ from unittest.mock import patch, mock_open
 # Add the parent directory to the path to import the generator
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Template directory relative to the generator's project root, joined once
+TEMPLATE_REL = os.path.join("control", "agents", "debugger")
+
 from debugger import DebuggerAgentGenerator
 
 
 class TestDebuggerAgentGenerator(unittest.TestCase):
     """Test cases for the DebuggerAgentGenerator class."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = Path(self.temp_dir) / "config.toml"
-        self.generator = DebuggerAgentGenerator(str(self.config_path))
-
-        # Create a sample debugger template
-        self.template_content = """You are an intelligent debugging agent that analyzes provided arguments to determine the optimal debugging approach.
+    # Template fixtures are read-only, so they are shared by every test
+    template_content = """You are an intelligent debugging agent that analyzes provided arguments to determine the optimal debugging approach.
 
 ## Core Responsibilities
 
@@ -38,8 +36,7 @@ class TestDebuggerAgentGenerator(unittest.TestCase):
 - **Adaptive Debugging**: Apply language-specific debugging techniques when configured languages are detected
 """
 
-        # Create sample language-specific templates
-        self.elixir_template = """### Core Tools & Commands
+    elixir_template = """### Core Tools & Commands
 
 **Basic Debugging:**
 
@@ -52,7 +49,7 @@ result |> dbg()
 ```
 """
 
-        self.kotlin_template = """### Kotlin Debugging Tools
+    kotlin_template = """### Kotlin Debugging Tools
 
 **Basic Debugging:**
 
@@ -65,7 +62,7 @@ debugger()
 ```
 """
 
-        self.typescript_template = """### TypeScript Debugging Tools
+    typescript_template = """### TypeScript Debugging Tools
 
 **Basic Debugging:**
 
@@ -78,33 +75,35 @@ debugger;
 ```
 """
 
-    def tearDown(self):
-        """Clean up test fixtures after each test method."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root for the class; each test gets a child directory."""
+        cls.temp_root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary root and every per-test directory under it."""
+        shutil.rmtree(cls.temp_root, ignore_errors=True)
 
-    def create_config_file(self, config_content: str):
-        """Helper method to create a config file with given content."""
-        with open(self.config_path, 'w') as f:
-            f.write(config_content)
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.temp_dir = tempfile.mkdtemp(dir=self.temp_root)
+        self.config_path = Path(self.temp_dir) / "config.toml"
+        self.generator = DebuggerAgentGenerator(str(self.config_path))
 
     def create_template_files(self, base_content: str = None, lang_contents: dict = None):
         """Helper method to create template files."""
         # Create debugger template directory
-        template_dir = Path(self.temp_dir) / "control/agents/debugger"
-        template_dir.mkdir(parents=True, exist_ok=True)
+        template_dir = os.path.join(self.temp_dir, TEMPLATE_REL)
+        os.makedirs(template_dir, exist_ok=True)
 
-        # Create base template
-        base_template_path = template_dir / "base.md"
-        with open(base_template_path, 'w') as f:
-            f.write(base_content or self.template_content)
-
-        # Create language-specific templates
+        # Base template first, then language-specific templates
+        templates = [("base.md", base_content or self.template_content)]
         if lang_contents:
-            for lang, content in lang_contents.items():
-                lang_template_path = template_dir / f"{lang}.md"
-                with open(lang_template_path, 'w') as f:
-                    f.write(content)
+            templates.extend((f"{lang}.md", content) for lang, content in lang_contents.items())
+
+        for name, content in templates:
+            Path(template_dir, name).write_text(content, encoding='utf-8')
 
     def test_load_toml_config_success(self):
         """Test successful TOML configuration loading."""
@@ -112,9 +111,9 @@ debugger;
 [opencode.agents.subagents]
 debugger = {enabled = true, template = "default", lang = "elixir"}
 """
-        self.create_config_file(config_content)
-
-        config = self.generator.load_toml_config()
+        # tomllib reads bytes, so serve the config from memory instead of disk
+        with patch('builtins.open', mock_open(read_data=config_content.encode())):
+            config = self.generator.load_toml_config()
 
         self.assertIn('opencode', config)
         self.assertIn('agents', config['opencode'])
@@ -128,148 +127,45 @@ debugger = {enabled = true, template = "default", lang = "elixir"}
 
     def test_load_toml_config_invalid_toml(self):
         """Test TOML configuration loading with invalid TOML syntax."""
-        self.create_config_file("invalid toml content [[[")
-
-        with self.assertRaises(ValueError):
-            self.generator.load_toml_config()
-
-    def test_validate_debugger_config_enabled(self):
-        """Test debugger configuration validation when enabled."""
-        config = {
-            'opencode': {
-                'agents': {
-                    'subagents': {
-                        'debugger': {'enabled': True, 'lang': 'elixir'}
-                    }
-                }
-            }
-        }
-
-        result = self.generator.validate_debugger_config(config)
-
-        self.assertIsNotNone(result)
-        self.assertTrue(result['enabled'])
-        self.assertEqual(result['lang'], 'elixir')
-
-    def test_validate_debugger_config_disabled(self):
-        """Test debugger configuration validation when disabled."""
-        config = {
-            'opencode': {
-                'agents': {
-                    'subagents': {
-                        'debugger': {'enabled': False}
-                    }
-                }
-            }
-        }
-
-        result = self.generator.validate_debugger_config(config)
-
-        self.assertIsNone(result)
-
-    def test_validate_debugger_config_missing(self):
-        """Test debugger configuration validation when config is missing."""
-        config = {'opencode': {'agents': {'subagents': {}}}}
-
-        result = self.generator.validate_debugger_config(config)
-
-        self.assertIsNone(result)
-
-    def test_validate_debugger_config_no_opencode_section(self):
-        """Test debugger configuration validation when opencode section is missing."""
-        config = {}
-
-        result = self.generator.validate_debugger_config(config)
-
-        self.assertIsNone(result)
-
-    def test_validate_and_read_template_default_elixir(self):
-        """Test template validation and reading with default template and Elixir language."""
-        self.create_template_files(
-            base_content=self.template_content,
-            lang_contents={'elixir': self.elixir_template}
-        )
-
-        # Update the generator's project root to point to our temp directory
-        self.generator.project_root = Path(self.temp_dir)
-
-        debugger_config = {
-            'template': 'default',
-            'lang': 'elixir',
-            'include_base_template': True,
-            'additional_files': [],
-            'additional_files_strategy': 'merge'
-        }
-
-        result = self.generator.validate_and_read_template(debugger_config)
-
-        self.assertIn("You are an intelligent debugging agent", result)
-        self.assertIn("# Elixir Debugging Specifics", result)
-        self.assertIn("Pipeline inspection", result)
-
-    def test_validate_and_read_template_default_kotlin(self):
-        """Test template validation and reading with default template and Kotlin language."""
-        self.create_template_files(
-            base_content=self.template_content,
-            lang_contents={'kotlin': self.kotlin_template}
-        )
-
-        # Update the generator's project root to point to our temp directory
-        self.generator.project_root = Path(self.temp_dir)
-
-        debugger_config = {
-            'template': 'default',
-            'lang': 'kotlin',
-            'include_base_template': True,
-            'additional_files': [],
-            'additional_files_strategy': 'merge'
-        }
-
-        result = self.generator.validate_and_read_template(debugger_config)
-
-        self.assertIn("You are an intelligent debugging agent", result)
-        self.assertIn("# Kotlin Debugging Specifics", result)
-        self.assertIn("Debug logging", result)
+        with patch('builtins.open', mock_open(read_data=b"invalid toml content [[[")):
+            with self.assertRaises(ValueError):
+                self.generator.load_toml_config()
 
-    def test_validate_and_read_template_default_typescript(self):
-        """Test template validation and reading with default template and TypeScript language."""
+    def test_validate_and_read_template_default_languages(self):
+        """Test template validation and reading with default template for each supported language."""
         self.create_template_files(
             base_content=self.template_content,
-            lang_contents={'typescript': self.typescript_template}
+            lang_contents={
+                'elixir': self.elixir_template,
+                'kotlin': self.kotlin_template,
+                'typescript': self.typescript_template
+            }
         )
 
         # Update the generator's project root to point to our temp directory
         self.generator.project_root = Path(self.temp_dir)
 
-        debugger_config = {
-            'template': 'default',
-            'lang': 'typescript',
-            'include_base_template': True,
-            'additional_files': [],
-            'additional_files_strategy': 'merge'
-        }
-
-        result = self.generator.validate_and_read_template(debugger_config)
-
-        self.assertIn("You are an intelligent debugging agent", result)
-        self.assertIn("# Typescript Debugging Specifics", result)
-        self.assertIn("console.log", result)
-
-    def test_validate_and_read_template_unsupported_language(self):
-        """Test template validation with unsupported language."""
-        debugger_config = {
-            'template': 'default',
-            'lang': 'python',  # Unsupported language
-            'include_base_template': True,
-            'additional_files': [],
-            'additional_files_strategy': 'merge'
-        }
+        cases = [
+            ('elixir', "# Elixir Debugging Specifics", "Pipeline inspection"),
+            ('kotlin', "# Kotlin Debugging Specifics", "Debug logging"),
+            ('typescript', "# Typescript Debugging Specifics", "console.log"),
+        ]
+
+        for lang, expected_header, expected_snippet in cases:
+            with self.subTest(lang=lang):
+                debugger_config = {
+                    'template': 'default',
+                    'lang': lang,
+                    'include_base_template': True,
+                    'additional_files': [],
+                    'additional_files_strategy': 'merge'
+                }
 
-        with self.assertRaises(ValueError) as context:
-            self.generator.validate_and_read_template(debugger_config)
+                result = self.generator.validate_and_read_template(debugger_config)
 
-        self.assertIn("Unsupported language: python", str(context.exception))
-        self.assertIn("elixir, kotlin, typescript", str(context.exception))
+                self.assertIn("You are an intelligent debugging agent", result)
+                self.assertIn(expected_header, result)
+                self.assertIn(expected_snippet, result)
 
     def test_validate_and_read_template_base_only(self):
         """Test template validation with base template only (no language)."""
@@ -319,8 +215,7 @@ debugger = {enabled = true, template = "default", lang = "elixir"}
         """Test template validation with custom template."""
         custom_template_content = "Custom debugger template content"
         custom_template_path = self.temp_dir / Path("custom_debugger.md")
-        with open(custom_template_path, 'w') as f:
-            f.write(custom_template_content)
+        custom_template_path.write_text(custom_template_content)
 
         debugger_config = {
             'template': 'custom',
@@ -333,6 +228,81 @@ debugger = {enabled = true, template = "default", lang = "elixir"}
 
         self.assertEqual(result, custom_template_content)
 
+
+class TestDebuggerAgentGeneratorHelpers(unittest.TestCase):
+    """Test cases for DebuggerAgentGenerator behaviour that needs no files on disk."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one generator for the class; these tests never mutate it."""
+        cls.generator = DebuggerAgentGenerator("config.toml")
+
+    def test_validate_debugger_config_enabled(self):
+        """Test debugger configuration validation when enabled."""
+        config = {
+            'opencode': {
+                'agents': {
+                    'subagents': {
+                        'debugger': {'enabled': True, 'lang': 'elixir'}
+                    }
+                }
+            }
+        }
+
+        result = self.generator.validate_debugger_config(config)
+
+        self.assertIsNotNone(result)
+        self.assertTrue(result['enabled'])
+        self.assertEqual(result['lang'], 'elixir')
+
+    def test_validate_debugger_config_disabled(self):
+        """Test debugger configuration validation when disabled."""
+        config = {
+            'opencode': {
+                'agents': {
+                    'subagents': {
+                        'debugger': {'enabled': False}
+                    }
+                }
+            }
+        }
+
+        result = self.generator.validate_debugger_config(config)
+
+        self.assertIsNone(result)
+
+    def test_validate_debugger_config_missing(self):
+        """Test debugger configuration validation when config is missing."""
+        config = {'opencode': {'agents': {'subagents': {}}}}
+
+        result = self.generator.validate_debugger_config(config)
+
+        self.assertIsNone(result)
+
+    def test_validate_debugger_config_no_opencode_section(self):
+        """Test debugger configuration validation when opencode section is missing."""
+        config = {}
+
+        result = self.generator.validate_debugger_config(config)
+
+        self.assertIsNone(result)
+
+    def test_validate_and_read_template_unsupported_language(self):
+        """Test template validation with unsupported language."""
+        debugger_config = {
+            'template': 'default',
+            'lang': 'python',  # Unsupported language
+            'include_base_template': True,
+            'additional_files': [],
+            'additional_files_strategy': 'merge'
+        }
+
+        with self.assertRaises(ValueError) as context:
+            self.generator.validate_and_read_template(debugger_config)
+
+        self.assertIn("Unsupported language: python", str(context.exception))
+        self.assertIn("elixir, kotlin, typescript", str(context.exception))
+
     def test_validate_and_read_template_custom_template_missing_file(self):
         """Test template validation with custom template but missing template_file."""
         debugger_config = {
@@ -374,29 +344,19 @@ debugger = {enabled = true, template = "default", lang = "elixir"}
 
         self.assertIn("Invalid additional_files_strategy: invalid_strategy", str(context.exception))
 
-    def test_get_output_path_subagent_mode(self):
-        """Test output path generation for subagent mode."""
-        debugger_config = {'mode': 'subagent'}
-
-        result = self.generator._get_output_path(debugger_config)
-
-        self.assertEqual(result, "generated/.opencode/agent/subagent/debugger.md")
-
-    def test_get_output_path_primary_mode(self):
-        """Test output path generation for primary mode."""
-        debugger_config = {'mode': 'primary'}
+    def test_get_output_path_modes(self):
+        """Test output path generation for subagent, primary and default (no mode specified) modes."""
+        cases = [
+            ({'mode': 'subagent'}, "generated/.opencode/agent/subagent/debugger.md"),
+            ({'mode': 'primary'}, "generated/.opencode/agent/debugger.md"),
+            ({}, "generated/.opencode/agent/debugger.md"),
+        ]
 
-        result = self.generator._get_output_path(debugger_config)
+        for debugger_config, expected_path in cases:
+            with self.subTest(mode=debugger_config.get('mode', 'default')):
+                result = self.generator._get_output_path(debugger_config)
 
-        self.assertEqual(result, "generated/.opencode/agent/debugger.md")
-
-    def test_get_output_path_default_mode(self):
-        """Test output path generation for default mode (no mode specified)."""
-        debugger_config = {}
-
-        result = self.generator._get_output_path(debugger_config)
-
-        self.assertEqual(result, "generated/.opencode/agent/debugger.md")
+                self.assertEqual(result, expected_path)
 
     def test_extract_agent_config_excludes_config_keys(self):
         """Test that agent configuration extraction excludes config-specific keys."""
@@ -492,6 +452,15 @@ This is content without closing frontmatter.
         # Should return original content if frontmatter is incomplete
         self.assertEqual(result, content_incomplete)
 
+    def test_strip_frontmatter_long_blank_run(self):
+        """Test stripping YAML frontmatter followed by a long run of blank lines."""
+        body = "Body line.\n" * 16000
+        content = "---\n" + "key: value\n" * 16000 + "---\n" + "\n" * 16000 + " \t\n" * 16000 + body
+
+        result = self.generator._strip_frontmatter(content)
+
+        self.assertEqual(result, body)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -7,6 +7,7 @@ covering configuration loading, validation, template handling, and agent file ge
 """
 
 import os
+import shutil
 import sys
 import tempfile
 import unittest
@@ -105,7 +106,6 @@ You are a multi-language documentation authoring and maintenance agent.
 
     def tearDown(self):
         """Clean up test fixtures after each test method."""
-        import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_load_toml_config_success(self):
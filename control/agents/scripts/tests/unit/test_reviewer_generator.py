@@ -7,6 +7,7 @@ covering configuration loading, validation, template handling, and agent file ge
 """
 
 import os
+import shutil
 import sys
 import tempfile
 import unittest
@@ -85,7 +86,6 @@ You are a code review, security, and quality assurance specialist.
 
     def tearDown(self):
         """Clean up test fixtures after each test method."""
-        import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_validate_reviewer_config_enabled(self):
@@ -1,6 +1,7 @@
 
 import json
 import os
+import re
 import sys
 import yaml
 from pathlib import Path
@@ -16,6 +17,11 @@ except ImportError:
         print("Please install tomli: pip install tomli", file=sys.stderr)
         sys.exit(1)
 
+# Same frontmatter pattern as optimizer.py
+FRONTMATTER_PATTERN = re.compile(
+    r"\A[^\S\n]*---[^\S\n]*\n(?:.*\n)*?[^\S\n]*---[^\S\n]*(?:\n|\Z)(?:[^\S\n]*\n)*(?:[^\S\n]*\Z)?"
+)
+
 
 class CleanConfigGenerator:
 
@@ -203,15 +209,9 @@ model: {model}
         print(f"Generated clean configuration (markdown): {output_path}")
 
     def _strip_frontmatter(self, content: str) -> str:
-        lines = content.split('\n')
-
-        if lines and lines[0].strip() == '---':
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    remaining_lines = lines[i+1:]
-                    while remaining_lines and not remaining_lines[0].strip():
-                        remaining_lines = remaining_lines[1:]
-                    return '\n'.join(remaining_lines)
+        match = FRONTMATTER_PATTERN.match(content)
+        if match:
+            return content[match.end():]
 
         return content
 
@@ -1,8 +1,8 @@
 
 import json
 import os
+import re
 import sys
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -19,16 +19,26 @@ except ImportError:
 BASE_TEMPLATE_PATH = "control/commands/generic/optimizer/base.md"
 LANG_TEMPLATE_PATH = "control/commands/generic/optimizer/{lang}.md"
 OUTPUT_PATH = "generated/.opencode/command/optimizer.md"
-SUPPORTED_LANGUAGES = ['elixir', 'kotlin', 'typescript']
+SUPPORTED_LANGUAGES = frozenset({'elixir', 'kotlin', 'typescript'})
+SUPPORTED_LANGUAGES_LIST = ', '.join(sorted(SUPPORTED_LANGUAGES))
+ADDITIONAL_FILES_STRATEGIES = frozenset({'merge', 'replace'})
+# Leading '---' fenced block plus any blank lines after it; fence lines may carry surrounding whitespace
+FRONTMATTER_PATTERN = re.compile(
+    r"\A[^\S\n]*---[^\S\n]*\n(?:.*\n)*?[^\S\n]*---[^\S\n]*(?:\n|\Z)(?:[^\S\n]*\n)*(?:[^\S\n]*\Z)?"
+)
 
 
 class OptimizerConfigGenerator:
 
-    def __init__(self, config_path: str = "config.toml"):
+    def __init__(self, config_path: str = "config.toml", preloaded_config: Optional[Dict[str, Any]] = None):
         self.config_path = Path(config_path)
         self.project_root = self.config_path.parent
+        self.preloaded_config = preloaded_config
 
     def load_toml_config(self) -> Dict[str, Any]:
+        if self.preloaded_config is not None:
+            return self.preloaded_config
+
         try:
             with open(self.config_path, 'rb') as f:
                 return tomllib.load(f)
@@ -51,11 +61,9 @@ class OptimizerConfigGenerator:
             return None
 
         lang = optimizer_config.get('lang', '')
-        if lang:
-            supported_langs = ['elixir', 'kotlin', 'typescript']
-            if lang not in supported_langs:
-                print(f"Language '{lang}' is not supported. Supported languages: {', '.join(supported_langs)}")
-                return None
+        if lang and lang not in SUPPORTED_LANGUAGES:
+            print(f"Language '{lang}' is not supported. Supported languages: {SUPPORTED_LANGUAGES_LIST}")
+            return None
 
         return optimizer_config
 
@@ -67,7 +75,7 @@ class OptimizerConfigGenerator:
         lang = optimizer_config.get('lang', '')
         include_base_template = optimizer_config.get('include_base_template', False)
 
-        if additional_files_strategy not in ['merge', 'replace']:
+        if additional_files_strategy not in ADDITIONAL_FILES_STRATEGIES:
             raise ValueError(f"Invalid additional_files_strategy: {additional_files_strategy}. Must be 'merge' or 'replace'")
 
         main_template_content = ""
@@ -157,17 +165,17 @@ class OptimizerConfigGenerator:
             if not additional_file_path.is_absolute():
                 additional_file_path = self.project_root / additional_file_path
 
-            if not additional_file_path.exists():
-                raise FileNotFoundError(f"Additional file not found: {additional_file_path}")
-
+            # Read directly and map a missing file to FileNotFoundError instead of stat-ing first
             try:
-                with open(additional_file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if content.strip():  # Only add non-empty files
-                        combined_content.append(f"## {additional_file_path.name}\n\n{content}")
+                content = additional_file_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Additional file not found: {additional_file_path}")
             except Exception as e:
                 raise ValueError(f"Failed to read additional file {additional_file_path}: {e}")
 
+            if content.strip():  # Only add non-empty files
+                combined_content.append(f"## {additional_file_path.name}\n\n{content}")
+
         return "\n\n".join(combined_content)
 
     def generate_yaml_config(self, optimizer_config: Dict[str, Any], template_content: str) -> Dict[str, Any]:
@@ -208,15 +216,9 @@ model: {model}
         print(f"Generated optimizer configuration (markdown): {output_path}")
 
     def _strip_frontmatter(self, content: str) -> str:
-        lines = content.split('\n')
-
-        if lines and lines[0].strip() == '---':
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    remaining_lines = lines[i+1:]
-                    while remaining_lines and not remaining_lines[0].strip():
-                        remaining_lines = remaining_lines[1:]
-                    return '\n'.join(remaining_lines)
+        match = FRONTMATTER_PATTERN.match(content)
+        if match:
+            return content[match.end():]
 
         return content
 
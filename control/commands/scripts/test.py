@@ -1,33 +1,51 @@
 
-import json
-import os
+import re
 import sys
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Dict, Any, Optional
 
-try:
-    import tomllib
-except ImportError:
-    try:
-        import tomli as tomllib
-    except ImportError:
-        print("Error: Neither tomllib (Python 3.11+) nor tomli package is available.", file=sys.stderr)
-        print("Please install tomli: pip install tomli", file=sys.stderr)
-        sys.exit(1)
-
 BASE_TEMPLATE_PATH = "control/commands/generic/test/base.md"
 LANG_TEMPLATE_PATH = "control/commands/generic/test/{lang}.md"
 OUTPUT_PATH = "generated/.opencode/command/test.md"
-SUPPORTED_LANGUAGES = ['elixir', 'kotlin', 'typescript']
+SUPPORTED_LANGUAGES = frozenset({'elixir', 'kotlin', 'typescript'})
+SUPPORTED_LANGUAGES_LIST = ', '.join(sorted(SUPPORTED_LANGUAGES))
+MAX_READ_WORKERS = 8
+FRONTMATTER_TEMPLATE = "---\ndescription: {description}\nagent: {agent}\nmodel: {model}\n---\n\n"
+# Leading '---' fenced block plus any blank lines after it; fence lines may carry surrounding whitespace
+FRONTMATTER_PATTERN = re.compile(
+    r"\A[^\S\n]*---[^\S\n]*\n(?:.*\n)*?[^\S\n]*---[^\S\n]*(?:\n|\Z)(?:[^\S\n]*\n)*(?:[^\S\n]*\Z)?"
+)
+
+
+@lru_cache(maxsize=1)
+def get_tomllib() -> ModuleType:
+    # Imported on first parse, so runs that never read a config file skip the parser import
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            print("Error: Neither tomllib (Python 3.11+) nor tomli package is available.", file=sys.stderr)
+            print("Please install tomli: pip install tomli", file=sys.stderr)
+            sys.exit(1)
+    return tomllib
 
 
 class TestConfigGenerator:
-    def __init__(self, config_path: str = "config.toml"):
+    def __init__(self, config_path: str = "config.toml", preloaded_config: Optional[Dict[str, Any]] = None):
         self.config_path = Path(config_path)
         self.project_root = self.config_path.parent
+        self.preloaded_config = preloaded_config
 
     def load_toml_config(self) -> Dict[str, Any]:
+        if self.preloaded_config is not None:
+            return self.preloaded_config
+
+        tomllib = get_tomllib()
         try:
             with open(self.config_path, 'rb') as f:
                 return tomllib.load(f)
@@ -37,9 +55,11 @@ class TestConfigGenerator:
             raise ValueError(f"Invalid TOML configuration: {e}")
 
     def validate_test_config(self, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        opencode_config = config.get('opencode', {})
-        commands_config = opencode_config.get('commands', {})
-        test_config = commands_config.get('test', {})
+        # Index directly rather than allocating an empty-dict default at each level
+        try:
+            test_config = config['opencode']['commands']['test']
+        except (KeyError, TypeError):
+            test_config = None
 
         if not test_config:
             print("No test configuration found in TOML file")
@@ -51,7 +71,7 @@ class TestConfigGenerator:
 
         lang = test_config.get('lang', '')
         if lang and lang not in SUPPORTED_LANGUAGES:
-            raise ValueError(f"Unsupported language: {lang}. Supported languages: {', '.join(SUPPORTED_LANGUAGES)}")
+            raise ValueError(f"Unsupported language: {lang}. Supported languages: {SUPPORTED_LANGUAGES_LIST}")
 
         return test_config
 
@@ -70,10 +90,13 @@ class TestConfigGenerator:
         if additional_files_strategy != 'replace' or not additional_files:
             if template_type == 'default':
                 template_content_parts = []
+                # Built once; both the base and the fallback branch read from it
+                base_template_path = self.project_root / BASE_TEMPLATE_PATH
+                base_exists = None
 
                 if include_base_template:
-                    base_template_path = self.project_root / "control/commands/generic/test/base.md"
-                    if base_template_path.exists():
+                    base_exists = base_template_path.exists()
+                    if base_exists:
                         try:
                             with open(base_template_path, 'r', encoding='utf-8') as f:
                                 base_content = f.read()
@@ -84,7 +107,7 @@ class TestConfigGenerator:
                         print(f"Warning: Base template not found at {base_template_path}")
 
                 if lang:
-                    lang_template_path = self.project_root / f"control/commands/generic/test/{lang}.md"
+                    lang_template_path = self.project_root / LANG_TEMPLATE_PATH.format(lang=lang)
                     if lang_template_path.exists():
                         try:
                             with open(lang_template_path, 'r', encoding='utf-8') as f:
@@ -98,8 +121,10 @@ class TestConfigGenerator:
                 if template_content_parts:
                     main_template_content = "\n\n".join(template_content_parts)
                 else:
-                    base_template_path = self.project_root / "control/commands/generic/test/base.md"
-                    if base_template_path.exists():
+                    # The fallback only runs when no base was read, so reuse an earlier miss
+                    if base_exists is None:
+                        base_exists = base_template_path.exists()
+                    if base_exists:
                         try:
                             with open(base_template_path, 'r', encoding='utf-8') as f:
                                 main_template_content = f.read()
@@ -116,10 +141,13 @@ class TestConfigGenerator:
                 if not custom_template_path.is_absolute():
                     custom_template_path = self.project_root / custom_template_path
 
-                if not custom_template_path.exists():
+                # One stat serves both the existence check and the emptiness check
+                try:
+                    custom_stat = custom_template_path.stat()
+                except (FileNotFoundError, NotADirectoryError):
                     raise FileNotFoundError(f"Custom template file not found: {custom_template_path}")
 
-                if custom_template_path.stat().st_size == 0:
+                if custom_stat.st_size == 0:
                     raise ValueError(f"Custom template file is empty: {custom_template_path}")
 
                 try:
@@ -146,25 +174,42 @@ class TestConfigGenerator:
         if not additional_files:
             return ""
 
-        combined_content = []
-
+        additional_file_paths = []
         for file_path in additional_files:
             additional_file_path = Path(file_path)
             if not additional_file_path.is_absolute():
                 additional_file_path = self.project_root / additional_file_path
+            additional_file_paths.append(additional_file_path)
 
-            if not additional_file_path.exists():
-                raise FileNotFoundError(f"Additional file not found: {additional_file_path}")
+        # Overlap the reads when there are several files; map() keeps the configured order
+        # and re-raises the first failing file's error, just as the sequential loop did
+        if len(additional_file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(additional_file_paths))) as executor:
+                contents = list(executor.map(self._read_additional_file, additional_file_paths))
+        else:
+            contents = [self._read_additional_file(path) for path in additional_file_paths]
+
+        combined_content = []
 
-            try:
-                with open(additional_file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if content.strip():  # Only add non-empty files
-                        combined_content.append(f"## {additional_file_path.name}\n\n{content}")
-            except Exception as e:
-                raise ValueError(f"Failed to read additional file {additional_file_path}: {e}")
+        for additional_file_path, content in zip(additional_file_paths, contents):
+            # Only add non-empty files; isspace() avoids the copy strip() would make.
+            # Headers and contents are kept as separate parts so each file is copied once, by the final join
+            if content and not content.isspace():
+                separator = "\n\n" if combined_content else ""
+                combined_content.append(f"{separator}## {additional_file_path.name}\n\n")
+                combined_content.append(content)
 
-        return "\n\n".join(combined_content)
+        return "".join(combined_content)
+
+    def _read_additional_file(self, additional_file_path: Path) -> str:
+        # Read directly and map a missing file to FileNotFoundError instead of stat-ing first
+        try:
+            with open(additional_file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Additional file not found: {additional_file_path}")
+        except Exception as e:
+            raise ValueError(f"Failed to read additional file {additional_file_path}: {e}")
 
     def generate_yaml_config(self, test_config: Dict[str, Any], template_content: str) -> Dict[str, Any]:
         return {
@@ -190,29 +235,20 @@ class TestConfigGenerator:
         agent = test_config.get('agent', 'build')
         model = test_config.get('model', 'anthropic/claude-sonnet-4-20250514')
 
-        complete_content = f"""---
-description: {description}
-agent: {agent}
-model: {model}
----
-
-{clean_content}"""
+        frontmatter = FRONTMATTER_TEMPLATE.format(description=description, agent=agent, model=model)
 
-        with open(output_file, 'w', encoding='utf-8', newline='\n') as f:
-            f.write(complete_content)
+        # Header and body are written separately rather than as one full-size copy; newline='\n'
+        # never translated anything, so binary mode writes the same bytes without the text wrapper
+        with open(output_file, 'wb') as f:
+            f.write(frontmatter.encode('utf-8'))
+            f.write(clean_content.encode('utf-8'))
 
         print(f"Generated test configuration (markdown): {output_path}")
 
     def _strip_frontmatter(self, content: str) -> str:
-        lines = content.split('\n')
-
-        if lines and lines[0].strip() == '---':
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    remaining_lines = lines[i+1:]
-                    while remaining_lines and not remaining_lines[0].strip():
-                        remaining_lines = remaining_lines[1:]
-                    return '\n'.join(remaining_lines)
+        match = FRONTMATTER_PATTERN.match(content)
+        if match:
+            return content[match.end():]
 
         return content
 
@@ -6,6 +6,7 @@ Tests the full workflow from TOML config to generated output file.
 """
 
 import os
+import shutil
 import sys
 import tempfile
 import unittest
@@ -19,10 +20,32 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "control" / "commands" / "scripts"))
 from clean import CleanConfigGenerator
 
+TEMPLATE_REL = "control/commands/generic/clean"
+TEMPLATE_FIXTURES = {
+    "base.md": "# Base Template\nBase Template Content",
+    "elixir.md": "# Elixir Template\nElixir Template Content",
+    "kotlin.md": "# Kotlin Template\nKotlin Template Content",
+    "typescript.md": "# TypeScript Template\nTypeScript Template Content",
+}
+
 
 class TestCleanIntegration(unittest.TestCase):
     """Integration test cases for CleanConfigGenerator."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Write the template tree once; tests hard-link it into their own project."""
+        cls.temp_root = tempfile.mkdtemp()
+        cls.template_root = Path(cls.temp_root) / "templates"
+        cls.template_root.mkdir()
+        for template_name, template_content in TEMPLATE_FIXTURES.items():
+            (cls.template_root / template_name).write_text(template_content)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared templates and every per-test project under the root."""
+        shutil.rmtree(cls.temp_root, ignore_errors=True)
+
     def setUp(self):
         """Set up test fixtures."""
         self.test_dir = Path(__file__).parent.parent
@@ -30,7 +53,7 @@ class TestCleanIntegration(unittest.TestCase):
 
     def test_full_workflow_with_elixir(self):
         """Test complete workflow with Elixir language configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self.temp_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # Create mock project structure
@@ -66,7 +89,7 @@ clean = { enabled = true, lang = "elixir", agent = "build", model = "anthropic/c
 
     def test_full_workflow_with_kotlin(self):
         """Test complete workflow with Kotlin language configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self.temp_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # Create mock project structure
@@ -98,7 +121,7 @@ clean = { enabled = true, lang = "kotlin", agent = "build", model = "anthropic/c
 
     def test_full_workflow_without_base_template(self):
         """Test complete workflow without base template."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self.temp_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # Create mock project structure
@@ -130,7 +153,7 @@ clean = { enabled = true, lang = "elixir", agent = "build", model = "anthropic/c
 
     def test_full_workflow_with_custom_template(self):
         """Test complete workflow with custom template."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self.temp_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # Create custom template
@@ -164,7 +187,7 @@ clean = {{ enabled = true, lang = "elixir", agent = "build", model = "anthropic/
 
     def test_full_workflow_with_additional_files(self):
         """Test complete workflow with additional files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self.temp_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # Create mock project structure
@@ -203,7 +226,7 @@ clean = {{ enabled = true, lang = "elixir", agent = "build", model = "anthropic/
 
     def test_full_workflow_disabled_config(self):
         """Test complete workflow with disabled configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self.temp_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # Create config file
@@ -228,7 +251,7 @@ clean = { enabled = false, lang = "elixir", agent = "build", model = "anthropic/
 
     def test_full_workflow_unsupported_language(self):
         """Test complete workflow with unsupported language."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=self.temp_root) as temp_dir:
             temp_path = Path(temp_dir)
 
             # Create config file
@@ -253,23 +276,8 @@ clean = { enabled = true, lang = "python", agent = "build", model = "anthropic/c
 
     def _create_mock_project_structure(self, temp_path: Path):
         """Create mock project structure with template files."""
-        # Create template directory
-        template_dir = temp_path / "control/commands/generic/clean"
-        template_dir.mkdir(parents=True)
-
-        # Create base template
-        base_template = template_dir / "base.md"
-        base_template.write_text("# Base Template\nBase Template Content")
-
-        # Create language templates
-        elixir_template = template_dir / "elixir.md"
-        elixir_template.write_text("# Elixir Template\nElixir Template Content")
-
-        kotlin_template = template_dir / "kotlin.md"
-        kotlin_template.write_text("# Kotlin Template\nKotlin Template Content")
-
-        typescript_template = template_dir / "typescript.md"
-        typescript_template.write_text("# TypeScript Template\nTypeScript Template Content")
+        # The generator only reads templates, so hard links to the shared tree are safe
+        shutil.copytree(self.template_root, temp_path / TEMPLATE_REL, copy_function=os.link)
 
 
 if __name__ == '__main__':
@@ -5,46 +5,55 @@ Integration tests for the OptimizerConfigGenerator class.
 Tests the full workflow integration with real template files and configurations.
 """
 
-import os
+import re
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-# Add the project root to the Python path
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Resolve shared paths once per process
+PROJECT_ROOT = Path(__file__).resolve().parents[5]
+TEST_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = TEST_DIR / "fixtures"
+NON_WHITESPACE = re.compile(rb"\S")
 
 # Import the optimizer module directly
-sys.path.insert(0, str(project_root / "control" / "commands" / "scripts"))
+sys.path.insert(0, str(PROJECT_ROOT / "control" / "commands" / "scripts"))
 from optimizer import OptimizerConfigGenerator
 
 
 class TestOptimizerIntegration(unittest.TestCase):
     """Integration test cases for OptimizerConfigGenerator."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Load the enabled fixture config once for the tests that share it."""
+        cls.enabled_generator = OptimizerConfigGenerator(str(FIXTURES_DIR / "optimizer_config_enabled.toml"))
+        
+        # Use the real project root for template files
+        cls.enabled_generator.project_root = PROJECT_ROOT
+        
+        cls.enabled_config = cls.enabled_generator.validate_optimizer_config(
+            cls.enabled_generator.load_toml_config()
+        )
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent.parent
-        self.fixtures_dir = self.test_dir / "fixtures"
-        self.project_root = project_root
+        self.test_dir = TEST_DIR
+        self.fixtures_dir = FIXTURES_DIR
+        self.project_root = PROJECT_ROOT
         
     def test_full_workflow_with_real_templates(self):
         """Test the complete workflow with real optimizer template files."""
-        config_path = self.fixtures_dir / "optimizer_config_enabled.toml"
-        
         with tempfile.TemporaryDirectory() as temp_dir:
-            generator = OptimizerConfigGenerator(str(config_path))
-            
-            # Use the real project root for template files
-            generator.project_root = self.project_root
+            generator = self.enabled_generator
             
             # Override output path to use temp directory
             temp_output_path = Path(temp_dir) / "optimizer.md"
             
-            # Load and validate config
-            config = generator.load_toml_config()
-            optimizer_config = generator.validate_optimizer_config(config)
+            # Config was loaded and validated once in setUpClass
+            optimizer_config = self.enabled_config
             
             self.assertIsNotNone(optimizer_config)
             
@@ -60,17 +69,17 @@ class TestOptimizerIntegration(unittest.TestCase):
             # Verify output file exists and has correct content
             self.assertTrue(temp_output_path.exists())
             
-            with open(temp_output_path, 'r') as f:
-                content = f.read()
+            content = temp_output_path.read_bytes()
             
             # Verify YAML frontmatter
-            self.assertIn("---", content)
-            self.assertIn("description: Optimizer command", content)
-            self.assertIn("agent: build", content)
-            self.assertIn("model: anthropic/claude-sonnet-4-20250514", content)
+            self.assertIn(b"---", content)
+            self.assertIn(b"description: Optimizer command", content)
+            self.assertIn(b"agent: build", content)
+            self.assertIn(b"model: anthropic/claude-sonnet-4-20250514", content)
             
             # Verify template content is included
-            self.assertGreater(len(content.split("---")[2].strip()), 0)
+            closing_frontmatter_index = content.index(b'\n---', 4)
+            self.assertGreater(len(content[closing_frontmatter_index + 4:].strip()), 0)
     
     def test_full_workflow_kotlin_language(self):
         """Test the complete workflow with Kotlin language configuration."""
@@ -91,11 +100,10 @@ class TestOptimizerIntegration(unittest.TestCase):
             # Verify the output
             self.assertTrue(temp_output_path.exists())
             
-            with open(temp_output_path, 'r') as f:
-                content = f.read()
+            content = temp_output_path.read_bytes()
             
-            self.assertIn("---", content)
-            self.assertIn("description: Optimizer command", content)
+            self.assertIn(b"---", content)
+            self.assertIn(b"description: Optimizer command", content)
     
     def test_full_workflow_with_custom_template(self):
         """Test the complete workflow with custom template configuration."""
@@ -105,53 +113,47 @@ class TestOptimizerIntegration(unittest.TestCase):
         config_content = f"""[opencode.commands]
 optimizer = {{ enabled = true, lang = "elixir", agent = "build", model = "anthropic/claude-sonnet-4-20250514", template = "custom", template_file = "{custom_template_path}", additional_files = [], additional_files_strategy = "merge", include_base_template = false }}"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as config_file:
-            config_file.write(config_content)
-            config_path = config_file.name
-        
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                generator = OptimizerConfigGenerator(config_path)
-                generator.project_root = self.project_root
-                
-                temp_output_path = Path(temp_dir) / "optimizer.md"
-                
-                # Run the full generation process
-                config = generator.load_toml_config()
-                optimizer_config = generator.validate_optimizer_config(config)
-                template_content = generator.validate_and_read_template(optimizer_config)
-                generator.write_yaml_config(optimizer_config, template_content, str(temp_output_path))
-                
-                # Verify the output
-                self.assertTrue(temp_output_path.exists())
-                
-                with open(temp_output_path, 'r') as f:
-                    content = f.read()
-                
-                self.assertIn("Custom Optimizer Template", content)
-                self.assertIn("optimize the code", content)
-        finally:
-            os.unlink(config_path)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "optimizer_config.toml"
+            config_path.write_text(config_content)
+            
+            generator = OptimizerConfigGenerator(str(config_path))
+            generator.project_root = self.project_root
+            
+            temp_output_path = Path(temp_dir) / "optimizer.md"
+            
+            # Run the full generation process
+            config = generator.load_toml_config()
+            optimizer_config = generator.validate_optimizer_config(config)
+            template_content = generator.validate_and_read_template(optimizer_config)
+            generator.write_yaml_config(optimizer_config, template_content, str(temp_output_path))
+            
+            # Verify the output
+            self.assertTrue(temp_output_path.exists())
+            
+            content = temp_output_path.read_bytes()
+            
+            self.assertIn(b"Custom Optimizer Template", content)
+            self.assertIn(b"optimize the code", content)
     
     def test_generate_method_full_integration(self):
         """Test the generate method with full integration."""
-        config_path = self.fixtures_dir / "optimizer_config_enabled.toml"
-        
         with tempfile.TemporaryDirectory() as temp_dir:
-            generator = OptimizerConfigGenerator(str(config_path))
-            generator.project_root = self.project_root
+            generator = self.enabled_generator
             
             # Override the output path to use temp directory
+            temp_output_path = str(Path(temp_dir) / "optimizer.md")
             original_write_method = generator.write_yaml_config
             
-            def mock_write_yaml_config(optimizer_config, template_content, output_path=None):
-                temp_output_path = Path(temp_dir) / "optimizer.md"
-                return original_write_method(optimizer_config, template_content, str(temp_output_path))
-            
-            generator.write_yaml_config = mock_write_yaml_config
-            
             # Run the generate method
-            result = generator.generate()
+            with patch.object(
+                generator,
+                'write_yaml_config',
+                side_effect=lambda optimizer_config, template_content, output_path=None: original_write_method(
+                    optimizer_config, template_content, temp_output_path
+                ),
+            ):
+                result = generator.generate()
             
             self.assertTrue(result)
             
@@ -160,27 +162,19 @@ optimizer = {{ enabled = true, lang = "elixir", agent = "build", model = "anthro
             self.assertTrue(output_file.exists())
             
             # Verify content structure
-            with open(output_file, 'r') as f:
-                content = f.read()
+            content = output_file.read_bytes()
             
-            lines = content.split('\n')
-            self.assertEqual(lines[0], '---')
-            self.assertIn('description:', content)
-            self.assertIn('agent:', content)
-            self.assertIn('model:', content)
+            self.assertTrue(content.startswith(b'---\n'))
+            self.assertIn(b'description:', content)
+            self.assertIn(b'agent:', content)
+            self.assertIn(b'model:', content)
             
             # Find the closing frontmatter
-            closing_frontmatter_index = None
-            for i, line in enumerate(lines[1:], 1):
-                if line.strip() == '---':
-                    closing_frontmatter_index = i
-                    break
-            
-            self.assertIsNotNone(closing_frontmatter_index)
+            closing_frontmatter_index = content.find(b'\n---', 4)
+            self.assertNotEqual(closing_frontmatter_index, -1)
             
-            # Verify there's content after the frontmatter
-            content_after_frontmatter = '\n'.join(lines[closing_frontmatter_index + 1:]).strip()
-            self.assertGreater(len(content_after_frontmatter), 0)
+            # Verify there's content after the frontmatter without copying the body
+            self.assertIsNotNone(NON_WHITESPACE.search(content, closing_frontmatter_index + 4))
 
 
 if __name__ == '__main__':
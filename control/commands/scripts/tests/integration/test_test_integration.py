@@ -6,54 +6,41 @@ This test suite validates the complete workflow of the TestConfigGenerator,
 including end-to-end configuration processing and file generation.
 """
 
+import json
+import importlib.util
 import os
+import shutil
 import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-# Add the scripts directory to the path to import the test generator
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from test import TestConfigGenerator
-
-
-class TestTestIntegration(unittest.TestCase):
-    """Integration test cases for TestConfigGenerator."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = Path(self.temp_dir) / "config.toml"
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create template directories
-        self.template_dir = Path(self.temp_dir) / "control" / "commands" / "generic" / "test"
-        self.template_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create output directory
-        self.output_dir = Path(self.temp_dir) / "generated" / ".opencode" / "command"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        self.generator = TestConfigGenerator(str(self.config_path))
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_full_workflow_enabled_configuration(self):
-        """Test complete workflow with enabled configuration."""
-        # Create TOML configuration
-        toml_content = """
-[opencode.commands]
-test = { enabled = true, lang = "elixir", agent = "build", model = "anthropic/claude-sonnet-4-20250514", template = "default", template_file = "", additional_files = [], additional_files_strategy = "merge", include_base_template = true }
-"""
-        with open(self.config_path, 'w') as f:
-            f.write(toml_content)
+# Load test.py under its own module name; importing it as "test" shadows the
+# stdlib test package, and caching it lets unit and integration suites share it
+if "test_command" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "test_command", Path(__file__).resolve().parent.parent.parent / "test.py"
+    )
+    test_command = importlib.util.module_from_spec(spec)
+    sys.modules["test_command"] = test_command
+    spec.loader.exec_module(test_command)
+
+TestConfigGenerator = sys.modules["test_command"].TestConfigGenerator
+
+DEFAULT_TEST_COMMAND = {
+    "enabled": True,
+    "lang": "elixir",
+    "agent": "build",
+    "model": "anthropic/claude-sonnet-4-20250514",
+    "template": "default",
+    "template_file": "",
+    "additional_files": [],
+    "additional_files_strategy": "merge",
+    "include_base_template": True,
+}
 
-        # Create base template
-        base_template_content = """# Test Base Template
+TEMPLATE_FIXTURES = {
+    "base.md": """# Test Base Template
 
 This is the base template for test commands.
 
@@ -61,13 +48,8 @@ This is the base template for test commands.
 - Write comprehensive tests
 - Follow TDD principles
 - Ensure good coverage
-"""
-        base_template_path = self.template_dir / "base.md"
-        with open(base_template_path, 'w') as f:
-            f.write(base_template_content)
-
-        # Create language-specific template
-        elixir_template_content = """# Elixir Test Template
+""",
+    "elixir.md": """# Elixir Test Template
 
 ## ExUnit Testing
 - Use `ExUnit` for unit tests
@@ -84,10 +66,82 @@ defmodule MyModuleTest do
   end
 end
 ```
-"""
-        elixir_template_path = self.template_dir / "elixir.md"
-        with open(elixir_template_path, 'w') as f:
-            f.write(elixir_template_content)
+""",
+    "kotlin.md": """# Kotlin Test Template
+
+## Kotlin Testing
+- Use JUnit for unit tests
+- Use MockK for mocking
+- Follow Kotlin testing conventions
+
+## Test Structure
+```kotlin
+class MyClassTest {
+    @Test
+    fun `should do something`() {
+        assertTrue(true)
+    }
+}
+```
+""",
+    "typescript.md": """# TypeScript Test Template
+
+## TypeScript Testing
+- Use Jest or Vitest for testing
+- Use TypeScript for type safety
+- Follow TypeScript testing conventions
+
+## Test Structure
+```typescript
+describe('MyClass', () => {
+  test('should do something', () => {
+    expect(true).toBe(true);
+  });
+});
+```
+""",
+}
+
+
+class TestTestIntegration(unittest.TestCase):
+    """Integration test cases for TestConfigGenerator."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Write the template fixtures once into a pristine directory copied by each test."""
+        # Per-test project directories live under the same root so one rmtree clears the whole class
+        cls.temp_root = tempfile.mkdtemp()
+        cls.template_root = Path(cls.temp_root) / "templates"
+        cls.template_root.mkdir()
+
+        for template_name, template_content in TEMPLATE_FIXTURES.items():
+            (cls.template_root / template_name).write_text(template_content)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the template fixtures and every per-test project directory."""
+        shutil.rmtree(cls.temp_root, ignore_errors=True)
+
+    def setUp(self):
+        """Set up a fresh project directory so no test sees another test's files."""
+        self.temp_dir = tempfile.mkdtemp(dir=self.temp_root)
+        shutil.copytree(self.template_root, Path(self.temp_dir) / "control" / "commands" / "generic" / "test")
+
+        self.config_path = Path(self.temp_dir) / "config.toml"
+        self.generator = TestConfigGenerator(str(self.config_path))
+
+    def _build_toml(self, **overrides) -> str:
+        """Build a TOML document for the test command from the defaults plus overrides."""
+        test_command = {**DEFAULT_TEST_COMMAND, **overrides}
+        fields = ", ".join(f"{key} = {json.dumps(value)}" for key, value in test_command.items())
+        return "\n".join(["[opencode.commands]", f"test = {{ {fields} }}", ""])
+
+    def test_full_workflow_enabled_configuration(self):
+        """Test complete workflow with enabled configuration."""
+        # Create TOML configuration
+        toml_content = self._build_toml()
+        with open(self.config_path, 'w') as f:
+            f.write(toml_content)
 
         # Run the generator
         result = self.generator.generate()
@@ -100,19 +154,18 @@ end
         self.assertTrue(output_file.exists())
 
         # Verify output file content
-        with open(output_file, 'r') as f:
-            content = f.read()
+        content = output_file.read_bytes()
 
         # Check YAML frontmatter
-        self.assertIn("---", content)
-        self.assertIn("description: Test command", content)
-        self.assertIn("agent: build", content)
-        self.assertIn("model: anthropic/claude-sonnet-4-20250514", content)
+        self.assertIn(b"---", content)
+        self.assertIn(b"description: Test command", content)
+        self.assertIn(b"agent: build", content)
+        self.assertIn(b"model: anthropic/claude-sonnet-4-20250514", content)
 
         # Check template content
-        self.assertIn("Test Base Template", content)
-        self.assertIn("Elixir Test Template", content)
-        self.assertIn("ExUnit Testing", content)
+        self.assertIn(b"Test Base Template", content)
+        self.assertIn(b"Elixir Test Template", content)
+        self.assertIn(b"ExUnit Testing", content)
 
     def test_full_workflow_disabled_configuration(self):
         """Test complete workflow with disabled configuration."""
@@ -137,41 +190,10 @@ test = { enabled = false, lang = "elixir" }
     def test_full_workflow_kotlin_configuration(self):
         """Test complete workflow with Kotlin configuration."""
         # Create TOML configuration for Kotlin
-        toml_content = """
-[opencode.commands]
-test = { enabled = true, lang = "kotlin", agent = "build", model = "anthropic/claude-sonnet-4-20250514", template = "default", template_file = "", additional_files = [], additional_files_strategy = "merge", include_base_template = true }
-"""
+        toml_content = self._build_toml(lang="kotlin")
         with open(self.config_path, 'w') as f:
             f.write(toml_content)
 
-        # Create base template
-        base_template_content = "# Test Base Template\n\nBase testing instructions."
-        base_template_path = self.template_dir / "base.md"
-        with open(base_template_path, 'w') as f:
-            f.write(base_template_content)
-
-        # Create Kotlin template
-        kotlin_template_content = """# Kotlin Test Template
-
-## Kotlin Testing
-- Use JUnit for unit tests
-- Use MockK for mocking
-- Follow Kotlin testing conventions
-
-## Test Structure
-```kotlin
-class MyClassTest {
-    @Test
-    fun `should do something`() {
-        assertTrue(true)
-    }
-}
-```
-"""
-        kotlin_template_path = self.template_dir / "kotlin.md"
-        with open(kotlin_template_path, 'w') as f:
-            f.write(kotlin_template_content)
-
         # Run the generator
         result = self.generator.generate()
 
@@ -180,43 +202,18 @@ class MyClassTest {
 
         # Verify output file content
         output_file = Path(self.temp_dir) / "generated" / ".opencode" / "command" / "test.md"
-        with open(output_file, 'r') as f:
-            content = f.read()
+        content = output_file.read_bytes()
 
-        self.assertIn("Kotlin Test Template", content)
-        self.assertIn("JUnit for unit tests", content)
+        self.assertIn(b"Kotlin Test Template", content)
+        self.assertIn(b"JUnit for unit tests", content)
 
     def test_full_workflow_typescript_configuration(self):
         """Test complete workflow with TypeScript configuration."""
         # Create TOML configuration for TypeScript
-        toml_content = """
-[opencode.commands]
-test = { enabled = true, lang = "typescript", agent = "build", model = "anthropic/claude-sonnet-4-20250514", template = "default", template_file = "", additional_files = [], additional_files_strategy = "merge", include_base_template = false }
-"""
+        toml_content = self._build_toml(lang="typescript", include_base_template=False)
         with open(self.config_path, 'w') as f:
             f.write(toml_content)
 
-        # Create TypeScript template (no base template)
-        typescript_template_content = """# TypeScript Test Template
-
-## TypeScript Testing
-- Use Jest or Vitest for testing
-- Use TypeScript for type safety
-- Follow TypeScript testing conventions
-
-## Test Structure
-```typescript
-describe('MyClass', () => {
-  test('should do something', () => {
-    expect(true).toBe(true);
-  });
-});
-```
-"""
-        typescript_template_path = self.template_dir / "typescript.md"
-        with open(typescript_template_path, 'w') as f:
-            f.write(typescript_template_content)
-
         # Run the generator
         result = self.generator.generate()
 
@@ -225,13 +222,12 @@ describe('MyClass', () => {
 
         # Verify output file content
         output_file = Path(self.temp_dir) / "generated" / ".opencode" / "command" / "test.md"
-        with open(output_file, 'r') as f:
-            content = f.read()
+        content = output_file.read_bytes()
 
-        self.assertIn("TypeScript Test Template", content)
-        self.assertIn("Jest or Vitest", content)
+        self.assertIn(b"TypeScript Test Template", content)
+        self.assertIn(b"Jest or Vitest", content)
         # Should not contain base template content since include_base_template = false
-        self.assertNotIn("Test Base Template", content)
+        self.assertNotIn(b"Test Base Template", content)
 
     def test_full_workflow_custom_template(self):
         """Test complete workflow with custom template."""
@@ -254,10 +250,7 @@ This is a custom template for test commands.
             f.write(custom_template_content)
 
         # Create TOML configuration with custom template
-        toml_content = f"""
-[opencode.commands]
-test = {{ enabled = true, agent = "build", model = "anthropic/claude-sonnet-4-20250514", template = "custom", template_file = "{custom_template_path}", additional_files = [], additional_files_strategy = "merge" }}
-"""
+        toml_content = self._build_toml(lang="", template="custom", template_file=str(custom_template_path), include_base_template=False)
         with open(self.config_path, 'w') as f:
             f.write(toml_content)
 
@@ -269,15 +262,14 @@ test = {{ enabled = true, agent = "build", model = "anthropic/claude-sonnet-4-20
 
         # Verify output file content
         output_file = Path(self.temp_dir) / "generated" / ".opencode" / "command" / "test.md"
-        with open(output_file, 'r') as f:
-            content = f.read()
+        content = output_file.read_bytes()
 
         # Check that custom template content is present (without its frontmatter)
-        self.assertIn("Custom Test Template", content)
-        self.assertIn("Custom Instructions", content)
+        self.assertIn(b"Custom Test Template", content)
+        self.assertIn(b"Custom Instructions", content)
         # The original frontmatter should be stripped and replaced
-        self.assertIn("description: Test command", content)  # Default description
-        self.assertNotIn("description: Custom Test Template", content)  # Original frontmatter stripped
+        self.assertIn(b"description: Test command", content)  # Default description
+        self.assertNotIn(b"description: Custom Test Template", content)  # Original frontmatter stripped
 
     def test_full_workflow_additional_files_merge(self):
         """Test complete workflow with additional files using merge strategy."""
@@ -294,25 +286,10 @@ test = {{ enabled = true, agent = "build", model = "anthropic/claude-sonnet-4-20
             f.write(additional_content)
 
         # Create TOML configuration with additional files
-        toml_content = f"""
-[opencode.commands]
-test = {{ enabled = true, lang = "elixir", agent = "build", model = "anthropic/claude-sonnet-4-20250514", template = "default", template_file = "", additional_files = ["{additional_file_path}"], additional_files_strategy = "merge", include_base_template = true }}
-"""
+        toml_content = self._build_toml(additional_files=[str(additional_file_path)])
         with open(self.config_path, 'w') as f:
             f.write(toml_content)
 
-        # Create base template
-        base_template_content = "# Test Base Template\n\nBase instructions."
-        base_template_path = self.template_dir / "base.md"
-        with open(base_template_path, 'w') as f:
-            f.write(base_template_content)
-
-        # Create language template
-        elixir_template_content = "# Elixir Test Template\n\nElixir-specific instructions."
-        elixir_template_path = self.template_dir / "elixir.md"
-        with open(elixir_template_path, 'w') as f:
-            f.write(elixir_template_content)
-
         # Run the generator
         result = self.generator.generate()
 
@@ -321,15 +298,14 @@ test = {{ enabled = true, lang = "elixir", agent = "build", model = "anthropic/c
 
         # Verify output file content
         output_file = Path(self.temp_dir) / "generated" / ".opencode" / "command" / "test.md"
-        with open(output_file, 'r') as f:
-            content = f.read()
+        content = output_file.read_bytes()
 
         # Check that all content is merged
-        self.assertIn("Test Base Template", content)
-        self.assertIn("Elixir Test Template", content)
-        self.assertIn("Additional Files", content)
-        self.assertIn("Additional Test Information", content)
-        self.assertIn("Testing Best Practices", content)
+        self.assertIn(b"Test Base Template", content)
+        self.assertIn(b"Elixir Test Template", content)
+        self.assertIn(b"Additional Files", content)
+        self.assertIn(b"Additional Test Information", content)
+        self.assertIn(b"Testing Best Practices", content)
 
     def test_full_workflow_additional_files_replace(self):
         """Test complete workflow with additional files using replace strategy."""
@@ -347,19 +323,10 @@ This completely replaces the default template.
             f.write(additional_content)
 
         # Create TOML configuration with replace strategy
-        toml_content = f"""
-[opencode.commands]
-test = {{ enabled = true, lang = "elixir", agent = "build", model = "anthropic/claude-sonnet-4-20250514", template = "default", template_file = "", additional_files = ["{additional_file_path}"], additional_files_strategy = "replace", include_base_template = true }}
-"""
+        toml_content = self._build_toml(additional_files=[str(additional_file_path)], additional_files_strategy="replace")
         with open(self.config_path, 'w') as f:
             f.write(toml_content)
 
-        # Create base template (should be ignored due to replace strategy)
-        base_template_content = "# Test Base Template\n\nThis should not appear."
-        base_template_path = self.template_dir / "base.md"
-        with open(base_template_path, 'w') as f:
-            f.write(base_template_content)
-
         # Run the generator
         result = self.generator.generate()
 
@@ -368,14 +335,13 @@ test = {{ enabled = true, lang = "elixir", agent = "build", model = "anthropic/c
 
         # Verify output file content
         output_file = Path(self.temp_dir) / "generated" / ".opencode" / "command" / "test.md"
-        with open(output_file, 'r') as f:
-            content = f.read()
+        content = output_file.read_bytes()
 
         # Check that only additional file content is present
-        self.assertIn("Replacement Test Template", content)
-        self.assertIn("Replacement Instructions", content)
+        self.assertIn(b"Replacement Test Template", content)
+        self.assertIn(b"Replacement Instructions", content)
         # Base template should not be present due to replace strategy
-        self.assertNotIn("Test Base Template", content)
+        self.assertNotIn(b"Test Base Template", content)
 
 
 if __name__ == '__main__':
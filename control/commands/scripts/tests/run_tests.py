@@ -3,48 +3,91 @@
 Test runner for commit configuration generator tests.
 
 Runs all unit and integration tests with proper reporting.
+Pass --parallel to run the unit and integration suites in separate processes.
 """
 
+import io
+import os
+import platform
 import sys
+import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+TESTS_DIR = Path(__file__).resolve().parent
+TEST_SUITES = ['unit', 'integration']
 
-def run_tests():
-    """Run all tests and return the result."""
-    # Discover and run all tests
+
+def use_memory_tmpdir():
+    """Keep test temp directories on tmpfs when running on Linux, unless TMPDIR is already set."""
+    # Kept in sync with use_memory_tmpdir() in control/agents/scripts/tests/run_tests.py
+    if platform.system() == 'Linux' and os.path.isdir('/dev/shm') and 'TMPDIR' not in os.environ:
+        os.environ['TMPDIR'] = '/dev/shm'
+        # Drop tempfile's cached directory so the new TMPDIR is picked up
+        tempfile.tempdir = None
+
+
+def run_suite(suite_name: str, parallel: bool = False) -> dict:
+    """Run a single test directory and return a picklable summary of the result."""
+    suite_dir = TESTS_DIR / suite_name
     loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2, buffer=True)
+    suite = loader.discover(suite_dir, pattern='test_*.py', top_level_dir=suite_dir)
+
+    # Buffer worker output so parallel suites don't interleave their reports
+    stream = io.StringIO() if parallel else sys.stderr
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2, buffer=True)
     result = runner.run(suite)
+
+    return {
+        'output': stream.getvalue() if parallel else '',
+        'tests_run': result.testsRun,
+        'failures': [(str(test), traceback) for test, traceback in result.failures],
+        'errors': [(str(test), traceback) for test, traceback in result.errors],
+        'skipped': len(result.skipped),
+    }
+
+
+def run_tests(parallel: bool = False):
+    """Run all tests and return the result."""
+    if parallel:
+        # Each suite owns its temp directories, so they can safely run side by side
+        with ProcessPoolExecutor(max_workers=len(TEST_SUITES)) as executor:
+            summaries = list(executor.map(run_suite, TEST_SUITES, [True] * len(TEST_SUITES)))
+        for summary in summaries:
+            sys.stderr.write(summary['output'])
+    else:
+        summaries = [run_suite(suite_name) for suite_name in TEST_SUITES]
+
+    tests_run = sum(summary['tests_run'] for summary in summaries)
+    failures = [failure for summary in summaries for failure in summary['failures']]
+    errors = [error for summary in summaries for error in summary['errors']]
+    skipped = sum(summary['skipped'] for summary in summaries)
     
     # Print summary
     print("\n" + "="*70)
     print("COMMAND GENERATOR TEST SUMMARY")
     print("="*70)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped) if hasattr(result, 'skipped') else 0}")
+    print(f"Tests run: {tests_run}")
+    print(f"Failures: {len(failures)}")
+    print(f"Errors: {len(errors)}")
+    print(f"Skipped: {skipped}")
     
-    if result.failures:
+    if failures:
         print("\nFAILURES:")
-        for test, traceback in result.failures:
+        for test, traceback in failures:
             print(f"- {test}: {traceback.split('AssertionError:')[-1].strip()}")
     
-    if result.errors:
+    if errors:
         print("\nERRORS:")
-        for test, traceback in result.errors:
+        for test, traceback in errors:
             print(f"- {test}: {traceback.split('Exception:')[-1].strip()}")
     
-    success = len(result.failures) == 0 and len(result.errors) == 0
+    success = len(failures) == 0 and len(errors) == 0
     print(f"\nResult: {'PASSED' if success else 'FAILED'}")
     print("="*70)
     
@@ -52,5 +95,6 @@ def run_tests():
 
 
 if __name__ == '__main__':
-    success = run_tests()
+    use_memory_tmpdir()
+    success = run_tests(parallel='--parallel' in sys.argv[1:])
     sys.exit(0 if success else 1)
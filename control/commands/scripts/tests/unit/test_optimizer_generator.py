@@ -5,37 +5,94 @@ Unit tests for the OptimizerConfigGenerator class.
 Tests all validation scenarios, template processing, language handling, and error handling.
 """
 
-import json
-import os
+import io
+import shutil
 import sys
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 
-# Add the project root to the Python path
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Resolve shared paths once per process
+PROJECT_ROOT = Path(__file__).resolve().parents[5]
+TEST_DIR = Path(__file__).resolve().parents[1]
+FIXTURES_DIR = TEST_DIR / "fixtures"
+
+# Add the project root and scripts directory to the Python path once per process
+for import_path in (str(PROJECT_ROOT), str(PROJECT_ROOT / "control" / "commands" / "scripts")):
+    if import_path not in sys.path:
+        sys.path.insert(0, import_path)
 
 # Import the optimizer module directly
-sys.path.insert(0, str(project_root / "control" / "commands" / "scripts"))
 from optimizer import OptimizerConfigGenerator
 
+# In-memory template files served to the patched open() by file name
+TEMPLATE_VFS = {
+    'base.md': "# Base Optimizer Template\n\nBase content",
+    'elixir.md': "# Elixir Optimizer Template\n\nElixir-specific content",
+    'kotlin.md': "# Kotlin Optimizer Template\n\nKotlin-specific content",
+}
+
 
 class TestOptimizerConfigGenerator(unittest.TestCase):
     """Test cases for OptimizerConfigGenerator."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Parse the shared TOML fixtures once for the whole class."""
+        cls.test_dir = TEST_DIR
+        cls.fixtures_dir = FIXTURES_DIR
+
+        # Shared by tests that don't change instance state; tests that set project_root build their own
+        cls.generator = OptimizerConfigGenerator()
+
+        cls.enabled_config = OptimizerConfigGenerator(
+            str(cls.fixtures_dir / "optimizer_config_enabled.toml")
+        ).load_toml_config()
+        cls.disabled_config = OptimizerConfigGenerator(
+            str(cls.fixtures_dir / "optimizer_config_disabled.toml")
+        ).load_toml_config()
+        cls.unsupported_lang_config = OptimizerConfigGenerator(
+            str(cls.fixtures_dir / "optimizer_config_unsupported_lang.toml")
+        ).load_toml_config()
+
+        cls.lang_configs = {
+            lang: {
+                'opencode': {
+                    'commands': {
+                        'optimizer': {
+                            'enabled': True,
+                            'lang': lang,
+                            'agent': 'build',
+                            'model': 'anthropic/claude-sonnet-4-20250514'
+                        }
+                    }
+                }
+            }
+            for lang in ('elixir', 'kotlin', 'typescript')
+        }
+
+        # Create mock template files once; tests that generate clean up their own output
+        cls.template_root = Path(tempfile.mkdtemp())
+        optimizer_dir = cls.template_root / "control" / "commands" / "generic" / "optimizer"
+        optimizer_dir.mkdir(parents=True)
+        (optimizer_dir / "base.md").write_text("# Base Optimizer Template")
+        (optimizer_dir / "elixir.md").write_text("# Elixir Optimizer Template")
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared template tree."""
+        shutil.rmtree(cls.template_root, ignore_errors=True)
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent.parent
-        self.fixtures_dir = self.test_dir / "fixtures"
+        """Reset the shared generator so tests don't depend on run order."""
+        self.generator.project_root = self.generator.config_path.parent
+        self.generator.preloaded_config = None
 
     def test_load_toml_config_success(self):
         """Test successful TOML configuration loading."""
-        config_path = self.fixtures_dir / "optimizer_config_enabled.toml"
-        generator = OptimizerConfigGenerator(str(config_path))
-
-        config = generator.load_toml_config()
+        # Loaded through load_toml_config() in setUpClass
+        config = self.enabled_config
 
         self.assertIn('opencode', config)
         self.assertIn('commands', config['opencode'])
@@ -52,26 +109,21 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
 
     def test_load_toml_config_invalid_toml(self):
         """Test TOML loading with invalid TOML syntax."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as f:
-            f.write("invalid toml [[[")
-            temp_path = f.name
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir) / "invalid.toml"
+            temp_path.write_text("invalid toml [[[")
 
-        try:
-            generator = OptimizerConfigGenerator(temp_path)
+            generator = OptimizerConfigGenerator(str(temp_path))
             with self.assertRaises(ValueError) as context:
                 generator.load_toml_config()
 
             self.assertIn("Invalid TOML configuration", str(context.exception))
-        finally:
-            os.unlink(temp_path)
 
     def test_validate_optimizer_config_enabled(self):
         """Test validation with enabled optimizer configuration."""
-        config_path = self.fixtures_dir / "optimizer_config_enabled.toml"
-        generator = OptimizerConfigGenerator(str(config_path))
+        generator = self.generator
 
-        config = generator.load_toml_config()
-        optimizer_config = generator.validate_optimizer_config(config)
+        optimizer_config = generator.validate_optimizer_config(self.enabled_config)
 
         self.assertIsNotNone(optimizer_config)
         self.assertTrue(optimizer_config['enabled'])
@@ -79,18 +131,16 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
 
     def test_validate_optimizer_config_disabled(self):
         """Test validation with disabled optimizer configuration."""
-        config_path = self.fixtures_dir / "optimizer_config_disabled.toml"
-        generator = OptimizerConfigGenerator(str(config_path))
+        generator = self.generator
 
-        config = generator.load_toml_config()
-        optimizer_config = generator.validate_optimizer_config(config)
+        optimizer_config = generator.validate_optimizer_config(self.disabled_config)
 
         self.assertIsNone(optimizer_config)
 
     def test_validate_optimizer_config_missing(self):
         """Test validation with missing optimizer configuration."""
         config = {'opencode': {'commands': {}}}
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
 
         optimizer_config = generator.validate_optimizer_config(config)
 
@@ -98,163 +148,23 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
 
     def test_validate_optimizer_config_supported_languages(self):
         """Test validation with supported languages."""
-        supported_langs = ['elixir', 'kotlin', 'typescript']
-
-        for lang in supported_langs:
-            config = {
-                'opencode': {
-                    'commands': {
-                        'optimizer': {
-                            'enabled': True,
-                            'lang': lang,
-                            'agent': 'build',
-                            'model': 'anthropic/claude-sonnet-4-20250514'
-                        }
-                    }
-                }
-            }
+        generator = self.generator
 
-            generator = OptimizerConfigGenerator()
-            optimizer_config = generator.validate_optimizer_config(config)
+        for lang, config in self.lang_configs.items():
+            with self.subTest(lang=lang):
+                optimizer_config = generator.validate_optimizer_config(config)
 
-            self.assertIsNotNone(optimizer_config, f"Language {lang} should be supported")
-            self.assertEqual(optimizer_config['lang'], lang)
+                self.assertIsNotNone(optimizer_config, f"Language {lang} should be supported")
+                self.assertEqual(optimizer_config['lang'], lang)
 
     def test_validate_optimizer_config_unsupported_language(self):
         """Test validation with unsupported language."""
-        config_path = self.fixtures_dir / "optimizer_config_unsupported_lang.toml"
-        generator = OptimizerConfigGenerator(str(config_path))
+        generator = self.generator
 
-        config = generator.load_toml_config()
-        optimizer_config = generator.validate_optimizer_config(config)
+        optimizer_config = generator.validate_optimizer_config(self.unsupported_lang_config)
 
         self.assertIsNone(optimizer_config)
 
-    def test_validate_and_read_template_default_with_base_and_lang(self):
-        """Test template validation with default template, base template, and language template."""
-        optimizer_config = {
-            'template': 'default',
-            'template_file': '',
-            'additional_files': [],
-            'additional_files_strategy': 'merge',
-            'lang': 'elixir',
-            'include_base_template': True
-        }
-
-        # Mock the file system
-        base_content = "# Base Optimizer Template\n\nBase content"
-        lang_content = "# Elixir Optimizer Template\n\nElixir-specific content"
-
-        with patch('builtins.open', mock_open()) as mock_file:
-            with patch('pathlib.Path.exists') as mock_exists:
-                mock_exists.return_value = True
-
-                # Configure mock to return different content for different files
-                def side_effect(*args, **kwargs):
-                    if 'base.md' in str(args[0]):
-                        return mock_open(read_data=base_content).return_value
-                    elif 'elixir.md' in str(args[0]):
-                        return mock_open(read_data=lang_content).return_value
-                    return mock_open().return_value
-
-                mock_file.side_effect = side_effect
-
-                generator = OptimizerConfigGenerator()
-                template_content = generator.validate_and_read_template(optimizer_config)
-
-                self.assertIn("Base content", template_content)
-                self.assertIn("Elixir-specific content", template_content)
-
-    def test_validate_and_read_template_default_base_only(self):
-        """Test template validation with default template and base template only."""
-        optimizer_config = {
-            'template': 'default',
-            'template_file': '',
-            'additional_files': [],
-            'additional_files_strategy': 'merge',
-            'lang': '',
-            'include_base_template': True
-        }
-
-        base_content = "# Base Optimizer Template\n\nBase content"
-
-        with patch('builtins.open', mock_open(read_data=base_content)) as mock_file:
-            with patch('pathlib.Path.exists') as mock_exists:
-                mock_exists.return_value = True
-
-                generator = OptimizerConfigGenerator()
-                template_content = generator.validate_and_read_template(optimizer_config)
-
-                self.assertEqual(template_content, base_content)
-
-    def test_validate_and_read_template_default_lang_only(self):
-        """Test template validation with default template and language template only."""
-        optimizer_config = {
-            'template': 'default',
-            'template_file': '',
-            'additional_files': [],
-            'additional_files_strategy': 'merge',
-            'lang': 'kotlin',
-            'include_base_template': False
-        }
-
-        lang_content = "# Kotlin Optimizer Template\n\nKotlin-specific content"
-
-        with patch('builtins.open', mock_open(read_data=lang_content)) as mock_file:
-            with patch('pathlib.Path.exists') as mock_exists:
-                def exists_side_effect(path):
-                    return 'kotlin.md' in str(path)
-
-                mock_exists.side_effect = exists_side_effect
-
-                generator = OptimizerConfigGenerator()
-                template_content = generator.validate_and_read_template(optimizer_config)
-
-                self.assertEqual(template_content, lang_content)
-
-    def test_validate_and_read_template_default_fallback_to_base(self):
-        """Test template validation with fallback to base template when no specific templates found."""
-        optimizer_config = {
-            'template': 'default',
-            'template_file': '',
-            'additional_files': [],
-            'additional_files_strategy': 'merge',
-            'lang': '',
-            'include_base_template': False
-        }
-
-        base_content = "# Base Optimizer Template\n\nFallback base content"
-
-        with patch('builtins.open', mock_open(read_data=base_content)) as mock_file:
-            with patch('pathlib.Path.exists') as mock_exists:
-                mock_exists.return_value = True
-
-                generator = OptimizerConfigGenerator()
-                template_content = generator.validate_and_read_template(optimizer_config)
-
-                self.assertEqual(template_content, base_content)
-
-    def test_validate_and_read_template_default_no_templates_found(self):
-        """Test template validation when no templates are found."""
-        optimizer_config = {
-            'template': 'default',
-            'template_file': '',
-            'additional_files': [],
-            'additional_files_strategy': 'merge',
-            'lang': '',
-            'include_base_template': False
-        }
-
-        with patch('pathlib.Path.exists') as mock_exists:
-            mock_exists.return_value = False
-
-            generator = OptimizerConfigGenerator()
-
-            with self.assertRaises(FileNotFoundError) as context:
-                generator.validate_and_read_template(optimizer_config)
-
-            self.assertIn("No template files found", str(context.exception))
-
     def test_validate_and_read_template_custom_valid(self):
         """Test template validation with valid custom template."""
         custom_template_path = self.fixtures_dir / "optimizer_custom_template.md"
@@ -268,7 +178,7 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
             'include_base_template': True
         }
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
         template_content = generator.validate_and_read_template(optimizer_config)
 
         self.assertIn("Custom Optimizer Template", template_content)
@@ -285,7 +195,7 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
             'include_base_template': True
         }
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
 
         with self.assertRaises(ValueError) as context:
             generator.validate_and_read_template(optimizer_config)
@@ -303,7 +213,7 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
             'include_base_template': True
         }
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
 
         with self.assertRaises(FileNotFoundError) as context:
             generator.validate_and_read_template(optimizer_config)
@@ -321,7 +231,7 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
             'include_base_template': True
         }
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
 
         with self.assertRaises(ValueError) as context:
             generator.validate_and_read_template(optimizer_config)
@@ -339,7 +249,7 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
             'include_base_template': True
         }
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
 
         with self.assertRaises(ValueError) as context:
             generator.validate_and_read_template(optimizer_config)
@@ -357,7 +267,7 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
             'include_base_template': True
         }
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
 
         with self.assertRaises(ValueError) as context:
             generator.validate_and_read_template(optimizer_config)
@@ -377,7 +287,7 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
             'include_base_template': False
         }
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
         template_content = generator.validate_and_read_template(optimizer_config)
 
         self.assertIn("Custom Optimizer Template", template_content)
@@ -397,23 +307,24 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
             'include_base_template': False
         }
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
         template_content = generator.validate_and_read_template(optimizer_config)
 
-        # Should only contain additional files content, not the main template
-        self.assertNotIn("Custom Optimizer Template", template_content)
-        self.assertIn("## optimizer_custom_template.md", template_content)
+        # Should only contain additional files content, not the main template.
+        # The additional file is the custom template itself, so check nothing precedes its section.
+        self.assertTrue(template_content.startswith("## optimizer_custom_template.md"))
+        self.assertNotIn("# Additional Files", template_content)
 
     def test_process_additional_files_empty_list(self):
         """Test processing empty additional files list."""
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
         result = generator._process_additional_files([])
 
         self.assertEqual(result, "")
 
     def test_process_additional_files_missing_file(self):
         """Test processing additional files with missing file."""
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
 
         with self.assertRaises(FileNotFoundError) as context:
             generator._process_additional_files(["nonexistent.md"])
@@ -428,7 +339,7 @@ class TestOptimizerConfigGenerator(unittest.TestCase):
         }
         template_content = "# Test Template"
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
         yaml_config = generator.generate_yaml_config(optimizer_config, template_content)
 
         self.assertEqual(yaml_config['$schema'], 'https://opencode.ai/config.json')
@@ -480,7 +391,7 @@ agent: build
 
 This is the actual content."""
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
         stripped_content = generator._strip_frontmatter(content_with_frontmatter)
 
         self.assertNotIn("---", stripped_content)
@@ -494,7 +405,7 @@ This is the actual content."""
 
 This is the actual content."""
 
-        generator = OptimizerConfigGenerator()
+        generator = self.generator
         stripped_content = generator._strip_frontmatter(content_without_frontmatter)
 
         self.assertEqual(stripped_content, content_without_frontmatter)
@@ -503,37 +414,98 @@ This is the actual content."""
         """Test successful generation workflow."""
         config_path = self.fixtures_dir / "optimizer_config_enabled.toml"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create mock template files
-            optimizer_dir = Path(temp_dir) / "control" / "commands" / "generic" / "optimizer"
-            optimizer_dir.mkdir(parents=True)
-
-            base_template = optimizer_dir / "base.md"
-            base_template.write_text("# Base Optimizer Template")
-
-            lang_template = optimizer_dir / "elixir.md"
-            lang_template.write_text("# Elixir Optimizer Template")
+        generator = OptimizerConfigGenerator(str(config_path))
+        generator.project_root = self.template_root
 
-            generator = OptimizerConfigGenerator(str(config_path))
-            generator.project_root = Path(temp_dir)
+        # Keep the shared template tree free of this test's output
+        self.addCleanup(shutil.rmtree, self.template_root / "generated", True)
 
-            result = generator.generate()
+        result = generator.generate()
 
-            self.assertTrue(result)
+        self.assertTrue(result)
 
-            # Verify output file was created
-            output_file = Path(temp_dir) / "generated" / ".opencode" / "command" / "optimizer.md"
-            self.assertTrue(output_file.exists())
+        # Verify output file was created
+        output_file = self.template_root / "generated" / ".opencode" / "command" / "optimizer.md"
+        self.assertTrue(output_file.exists())
 
     def test_generate_disabled_config(self):
         """Test generation with disabled configuration."""
         config_path = self.fixtures_dir / "optimizer_config_disabled.toml"
 
-        generator = OptimizerConfigGenerator(str(config_path))
+        # Reuse the config parsed in setUpClass instead of reading the file again
+        generator = OptimizerConfigGenerator(str(config_path), preloaded_config=self.disabled_config)
         result = generator.generate()
 
         self.assertFalse(result)
 
 
+class TestOptimizerDefaultTemplates(unittest.TestCase):
+    """Default template assembly against the in-memory TEMPLATE_VFS."""
+
+    # Names of the TEMPLATE_VFS entries the patched Path.exists reports as present
+    existing_templates = set()
+
+    @classmethod
+    def setUpClass(cls):
+        """Install the open() and Path.exists patches once for the whole class."""
+        patchers = [
+            patch('builtins.open', new=lambda path, *args, **kwargs: io.StringIO(TEMPLATE_VFS[Path(path).name])),
+            patch.object(Path, 'exists', new=lambda path: path.name in cls.existing_templates),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+        cls.generator = OptimizerConfigGenerator()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.existing_templates.clear()
+
+    def test_validate_and_read_template_default_templates(self):
+        """Test default template assembly for each base/language template combination."""
+        # (case, lang, include_base_template, existing templates, expected content)
+        cases = [
+            ('with_base_and_lang', 'elixir', True, {'base.md', 'elixir.md'},
+             f"{TEMPLATE_VFS['base.md']}\n\n{TEMPLATE_VFS['elixir.md']}"),
+            ('base_only', '', True, set(TEMPLATE_VFS), TEMPLATE_VFS['base.md']),
+            ('lang_only', 'kotlin', False, {'kotlin.md'}, TEMPLATE_VFS['kotlin.md']),
+            ('fallback_to_base', '', False, set(TEMPLATE_VFS), TEMPLATE_VFS['base.md']),
+        ]
+
+        for case, lang, include_base_template, existing, expected in cases:
+            with self.subTest(case=case):
+                self.existing_templates.clear()
+                self.existing_templates.update(existing)
+                optimizer_config = {
+                    'template': 'default',
+                    'template_file': '',
+                    'additional_files': [],
+                    'additional_files_strategy': 'merge',
+                    'lang': lang,
+                    'include_base_template': include_base_template
+                }
+
+                template_content = self.generator.validate_and_read_template(optimizer_config)
+
+                self.assertEqual(template_content, expected)
+
+    def test_validate_and_read_template_default_no_templates_found(self):
+        """Test template validation when no templates are found."""
+        optimizer_config = {
+            'template': 'default',
+            'template_file': '',
+            'additional_files': [],
+            'additional_files_strategy': 'merge',
+            'lang': '',
+            'include_base_template': False
+        }
+
+        with self.assertRaises(FileNotFoundError) as context:
+            self.generator.validate_and_read_template(optimizer_config)
+
+        self.assertIn("No template files found", str(context.exception))
+
+
 if __name__ == '__main__':
     unittest.main()
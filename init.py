@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 
+import os
+import re
 import sys
 import subprocess
 import importlib.util
 import io
 import contextlib
+import contextvars
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
@@ -13,40 +18,127 @@ try:
 except ImportError:
     from importlib_metadata import version, PackageNotFoundError
 
+MAX_GENERATOR_WORKERS = 16
+MAX_CAPTURED_LINE = 64 * 1024
+CAPTURE_WARNINGS = os.environ.get('OPENCODE_CAPTURE_WARNINGS', '1') == '1'
+WARNING_PATTERN = re.compile(r'^[^\S\n]*(Warning:.*?)[^\S\n]*$', re.MULTILINE)
+REQUIREMENT_PATTERN = re.compile(r'^([A-Za-z0-9_.\-]+)\s*(?:(>=|==)\s*(.*))?$')
+
+GENERATOR_CLASS_MAP = {
+    'coder_agent': 'CoderAgentGenerator',
+    'blockchain_agent': 'BlockchainAgentGenerator',
+    'code_pattern_analyst': 'CodePatternAnalystAgentGenerator',
+    'codebase_agent': 'CodebaseAgentGenerator',
+    'debugger': 'DebuggerAgentGenerator',
+    'documentation': 'DocumentationAgentGenerator',
+    'reviewer': 'ReviewerAgentGenerator',
+    'task_manager': 'TaskManagerAgentGenerator',
+    'tester': 'TesterAgentGenerator',
+    'clean': 'CleanConfigGenerator',
+    'commit': 'CommitConfigGenerator',
+    'context': 'ContextConfigGenerator',
+    'optimizer': 'OptimizerConfigGenerator',
+    'prompter': 'PrompterConfigGenerator',
+    'test': 'TestConfigGenerator',
+    'worktrees': 'WorktreesConfigGenerator'
+}
+
+# Per-worker capture buffer; unset in the main thread so its prints reach the terminal
+CAPTURED_OUTPUT = contextvars.ContextVar('captured_output', default=None)
+
+class ContextStdout:
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def _target(self):
+        captured_output = CAPTURED_OUTPUT.get()
+        return captured_output if captured_output is not None else self.fallback
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+@lru_cache(maxsize=None)
+def get_pkg_version() -> Any:
+    try:
+        from packaging import version as pkg_version
+    except ImportError:
+        return None
+    return pkg_version
+
+@lru_cache(maxsize=None)
+def resolve_version(package_name: str) -> str:
+    return version(package_name)
+
+def parse_requirements(requirements_file: Path) -> List[Tuple[str, str, Any]]:
+    requirements = []
+    with open(requirements_file, 'r') as f:
+        for line in f:
+            req = line.strip()
+            if not req or line.startswith('#'):
+                continue
+            match = REQUIREMENT_PATTERN.match(req)
+            if match:
+                package_name, _, required_version = match.groups()
+                requirements.append((req, package_name, required_version or None))
+            else:
+                requirements.append((req, req, None))
+    
+    return requirements
+
+class WarningCapture(io.TextIOBase):
+    # Extracts warning lines as output streams in, holding at most one partial line
+    def __init__(self):
+        super().__init__()
+        self.warnings = []
+        self.pending = ''
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        lines = (self.pending + text).split('\n')
+        self.pending = lines.pop()[:MAX_CAPTURED_LINE]
+        for line in lines:
+            self._collect(line)
+        return len(text)
+
+    def _collect(self, line: str) -> None:
+        match = WARNING_PATTERN.match(line)
+        if match:
+            self.warnings.append(match.group(1))
+
+    def collected_warnings(self) -> List[str]:
+        if self.pending:
+            self._collect(self.pending)
+            self.pending = ''
+        return self.warnings
+
 def check_requirements() -> bool:
     requirements_file = Path("requirements.txt")
     if not requirements_file.exists():
         print("❌ requirements.txt not found")
         return False
     
-    with open(requirements_file, 'r') as f:
-        requirements = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    requirements = parse_requirements(requirements_file)
     
     missing_packages = []
     installed_packages = []
+    pkg_version = get_pkg_version()
     
-    for req in requirements:
-        if '>=' in req:
-            package_name = req.split('>=')[0].strip()
-            required_version = req.split('>=')[1].strip()
-        elif '==' in req:
-            package_name = req.split('==')[0].strip()
-            required_version = req.split('==')[1].strip()
-        else:
-            package_name = req.strip()
-            required_version = None
-        
+    for req, package_name, required_version in requirements:
         try:
-            installed_version = version(package_name)
-            if required_version:
-                try:
-                    from packaging import version as pkg_version
-                    if pkg_version.parse(installed_version) >= pkg_version.parse(required_version):
-                        installed_packages.append(f"{package_name} (v{installed_version})")
-                    else:
-                        missing_packages.append(req)
-                except ImportError:
+            installed_version = resolve_version(package_name)
+            if required_version and pkg_version:
+                if pkg_version.parse(installed_version) >= pkg_version.parse(required_version):
                     installed_packages.append(f"{package_name} (v{installed_version})")
+                else:
+                    missing_packages.append(req)
             else:
                 installed_packages.append(f"{package_name} (v{installed_version})")
         except PackageNotFoundError:
@@ -66,7 +158,9 @@ def check_requirements() -> bool:
         response = input("\n📦 Install missing packages? (y/N): ").strip().lower()
         if response in ['y', 'yes']:
             try:
-                subprocess.check_call([sys.executable, '-m', 'pip', 'install'] + missing_packages)
+                # Prefer wheels to skip local builds; -q keeps pip's progress out of our report
+                subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--prefer-binary', '-q'] + missing_packages)
+                resolve_version.cache_clear()
                 print("✅ Packages installed successfully")
                 return True
             except subprocess.CalledProcessError:
@@ -85,65 +179,61 @@ def check_requirements() -> bool:
     return True
 
 def import_generator_class(module_path: Path) -> Any:
-    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    class_name = GENERATOR_CLASS_MAP.get(module_path.stem)
+    if class_name is None:
+        return None
+    resolved_path = module_path.resolve()
+    
+    # Agent and command scripts share stems across directories, so qualify the module name
+    module_name = f"{resolved_path.parent.parent.name}_{module_path.stem}"
+    spec = importlib.util.spec_from_file_location(module_name, resolved_path)
     module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
     
-    class_name_map = {
-        'coder_agent': 'CoderAgentGenerator',
-        'blockchain_agent': 'BlockchainAgentGenerator',
-        'code_pattern_analyst': 'CodePatternAnalystAgentGenerator', 
-        'codebase_agent': 'CodebaseAgentGenerator',
-        'debugger': 'DebuggerAgentGenerator',
-        'documentation': 'DocumentationAgentGenerator',
-        'reviewer': 'ReviewerAgentGenerator',
-        'task_manager': 'TaskManagerAgentGenerator',
-        'tester': 'TesterAgentGenerator',
-        'clean': 'CleanConfigGenerator',
-        'commit': 'CommitConfigGenerator',
-        'context': 'ContextConfigGenerator',
-        'optimizer': 'OptimizerConfigGenerator',
-        'prompter': 'PrompterConfigGenerator',
-        'test': 'TestConfigGenerator',
-        'worktrees': 'WorktreesConfigGenerator'
-    }
+    return vars(module).get(class_name)
+
+def scan_generator_scripts(scripts_dir: Path) -> List[Path]:
+    scripts = []
+    try:
+        with os.scandir(scripts_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.py') or name.startswith('test_') or name == '__init__.py':
+                    continue
+                if entry.is_file():
+                    scripts.append(Path(entry.path))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
     
-    class_name = class_name_map.get(module_path.stem)
-    if class_name and hasattr(module, class_name):
-        return getattr(module, class_name)
-    return None
+    scripts.sort(key=lambda script: script.name)
+    return scripts
 
 def discover_generators() -> Tuple[List[Path], List[Path]]:
-    agent_scripts = []
-    command_scripts = []
-    
-    agents_dir = Path("control/agents/scripts")
-    if agents_dir.exists():
-        for script in agents_dir.glob("*.py"):
-            if not script.name.startswith('test_') and script.name != '__init__.py' and 'tests' not in str(script):
-                agent_scripts.append(script)
-    
-    commands_dir = Path("control/commands/scripts")
-    if commands_dir.exists():
-        for script in commands_dir.glob("*.py"):
-            if not script.name.startswith('test_') and script.name != '__init__.py' and 'tests' not in str(script):
-                command_scripts.append(script)
+    agent_scripts = scan_generator_scripts(Path("control/agents/scripts"))
+    command_scripts = scan_generator_scripts(Path("control/commands/scripts"))
     
-    return sorted(agent_scripts), sorted(command_scripts)
+    return agent_scripts, command_scripts
 
 def run_generator(generator_class: Any, config_path: str = "config.toml") -> Dict[str, Any]:
+    # With capture disabled the generator prints straight through and no warnings are collected
+    captured_output = WarningCapture() if CAPTURE_WARNINGS else None
+    token = CAPTURED_OUTPUT.set(captured_output)
+    # sys.stdout is process-wide, so parallel workers only swap it when main() hasn't installed ContextStdout
+    if captured_output is None or isinstance(sys.stdout, ContextStdout):
+        stdout_redirect = contextlib.nullcontext()
+    else:
+        stdout_redirect = contextlib.redirect_stdout(captured_output)
     try:
-        captured_output = io.StringIO()
-        with contextlib.redirect_stdout(captured_output):
+        with stdout_redirect:
             generator = generator_class(config_path)
             success = generator.generate()
         
-        output = captured_output.getvalue()
-        warnings = []
-        
-        for line in output.split('\n'):
-            if line.strip().startswith('Warning:'):
-                warnings.append(line.strip())
+        warnings = captured_output.collected_warnings() if captured_output else []
         
         return {
             'success': success,
@@ -158,11 +248,36 @@ def run_generator(generator_class: Any, config_path: str = "config.toml") -> Dic
             'skipped': False,
             'warnings': []
         }
+    finally:
+        CAPTURED_OUTPUT.reset(token)
+
+def run_script(name: str, script: Path) -> Tuple[str, Dict[str, Any]]:
+    generator_class = import_generator_class(script)
+    if generator_class:
+        return name, run_generator(generator_class)
+    return name, {
+        'success': False,
+        'error': 'Could not import generator class',
+        'skipped': False,
+        'warnings': [],
+        'import_failed': True
+    }
+
+def format_status(name: str, result: Dict[str, Any]) -> List[str]:
+    if result.get('import_failed'):
+        return [f"   ❌ {name} (import failed)"]
+    if result['success']:
+        return [f"   ✅ {name}"] + [f"      ⚠️  {warning}" for warning in result.get('warnings', [])]
+    if result['skipped']:
+        return [f"   ⏭️  {name} (skipped)"]
+    return [f"   ❌ {name} (failed)"]
 
 def format_results(results: Dict[str, Dict[str, Any]]) -> None:
-    print("\n" + "="*60)
-    print("🚀 OPENCODE AGENTS INITIALIZATION RESULTS")
-    print("="*60)
+    lines = [
+        "\n" + "="*60,
+        "🚀 OPENCODE AGENTS INITIALIZATION RESULTS",
+        "="*60
+    ]
     
     successful = []
     skipped = []
@@ -177,32 +292,34 @@ def format_results(results: Dict[str, Dict[str, Any]]) -> None:
             failed.append((name, result['error']))
     
     if successful:
-        print(f"\n✅ SUCCESSFUL GENERATIONS ({len(successful)}):")
-        for name in successful:
-            print(f"   ✓ {name}")
+        lines.append(f"\n✅ SUCCESSFUL GENERATIONS ({len(successful)}):")
+        lines.extend(f"   ✓ {name}" for name in successful)
     
     if skipped:
-        print(f"\n⏭️  SKIPPED GENERATIONS ({len(skipped)}):")
-        for name in skipped:
-            print(f"   - {name} (disabled or no config)")
+        lines.append(f"\n⏭️  SKIPPED GENERATIONS ({len(skipped)}):")
+        lines.extend(f"   - {name} (disabled or no config)" for name in skipped)
     
     if failed:
-        print(f"\n❌ FAILED GENERATIONS ({len(failed)}):")
-        for name, error in failed:
-            print(f"   ✗ {name}: {error}")
+        lines.append(f"\n❌ FAILED GENERATIONS ({len(failed)}):")
+        lines.extend(f"   ✗ {name}: {error}" for name, error in failed)
     
-    print(f"\n📊 SUMMARY:")
-    print(f"   Total: {len(results)}")
-    print(f"   Successful: {len(successful)}")
-    print(f"   Skipped: {len(skipped)}")
-    print(f"   Failed: {len(failed)}")
+    lines.extend([
+        f"\n📊 SUMMARY:",
+        f"   Total: {len(results)}",
+        f"   Successful: {len(successful)}",
+        f"   Skipped: {len(skipped)}",
+        f"   Failed: {len(failed)}"
+    ])
     
     if failed:
-        print(f"\n⚠️  {len(failed)} generator(s) failed. Check configuration and try again.")
+        lines.append(f"\n⚠️  {len(failed)} generator(s) failed. Check configuration and try again.")
     elif successful:
-        print(f"\n🎉 {len(successful)} generator(s) completed successfully!")
+        lines.append(f"\n🎉 {len(successful)} generator(s) completed successfully!")
     else:
-        print(f"\n ℹ️  All generators were skipped. Check your configuration.")
+        lines.append(f"\n ℹ️  All generators were skipped. Check your configuration.")
+    
+    # One write keeps captured CI logs from flushing per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     print("🔧 OpenCode Agents Initialization")
@@ -225,51 +342,32 @@ def main():
     
     print(f"\n⚙️  Running {total_generators} generators...")
     
-    results = {}
+    scripts = [
+        (f"{kind}/{script.stem}", script)
+        for kind, kind_scripts in (('agent', agent_scripts), ('command', command_scripts))
+        for script in kind_scripts
+    ]
     
-    for script in agent_scripts:
-        generator_class = import_generator_class(script)
-        if generator_class:
-            result = run_generator(generator_class)
-            results[f"agent/{script.stem}"] = result
-            if result['success']:
-                print(f"   ✅ agent/{script.stem}")
-                for warning in result.get('warnings', []):
-                    print(f"      ⚠️  {warning}")
-            elif result['skipped']:
-                print(f"   ⏭️  agent/{script.stem} (skipped)")
-            else:
-                print(f"   ❌ agent/{script.stem} (failed)")
-        else:
-            results[f"agent/{script.stem}"] = {
-                'success': False,
-                'error': 'Could not import generator class',
-                'skipped': False,
-                'warnings': []
-            }
-            print(f"   ❌ agent/{script.stem} (import failed)")
+    # Keep the summary in discovery order while status lines stream in completion order
+    results = dict.fromkeys(name for name, _ in scripts)
     
-    for script in command_scripts:
-        generator_class = import_generator_class(script)
-        if generator_class:
-            result = run_generator(generator_class)
-            results[f"command/{script.stem}"] = result
-            if result['success']:
-                print(f"   ✅ command/{script.stem}")
-                for warning in result.get('warnings', []):
-                    print(f"      ⚠️  {warning}")
-            elif result['skipped']:
-                print(f"   ⏭️  command/{script.stem} (skipped)")
-            else:
-                print(f"   ❌ command/{script.stem} (failed)")
-        else:
-            results[f"command/{script.stem}"] = {
-                'success': False,
-                'error': 'Could not import generator class',
-                'skipped': False,
-                'warnings': []
-            }
-            print(f"   ❌ command/{script.stem} (import failed)")
+    # Stream status lines to a terminal; batch them when output is captured
+    interactive = sys.stdout.isatty()
+    status_lines = []
+    
+    with contextlib.redirect_stdout(ContextStdout(sys.stdout)):
+        with ThreadPoolExecutor(max_workers=min(MAX_GENERATOR_WORKERS, total_generators)) as executor:
+            futures = [executor.submit(run_script, name, script) for name, script in scripts]
+            for future in as_completed(futures):
+                name, result = future.result()
+                results[name] = result
+                if interactive:
+                    print("\n".join(format_status(name, result)))
+                else:
+                    status_lines.extend(format_status(name, result))
+    
+    if status_lines:
+        sys.stdout.write("\n".join(status_lines) + "\n")
     
     format_results(results)
 